@@ -7,10 +7,11 @@ rankings that minimize ranking anomalies (cases where lower-ranked wrestlers
 beat higher-ranked ones).
 """
 
+import hashlib
 import json
 import random
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
 try:
@@ -42,9 +43,10 @@ def count_anomalies(ordering: List[int], adjacency_matrix, wrestler_count: int)
     
     # Check all pairs
     for i in range(wrestler_count):
+        rank_i = rank[i]
         for j in range(i + 1, wrestler_count):
             # If j is ranked higher (lower rank number) but i beat j, that's an anomaly
-            if rank[j] < rank[i]:  # j is ranked higher
+            if rank[j] < rank_i:  # j is ranked higher
                 if isinstance(adjacency_matrix, dict):
                     # Dict-based matrix
                     key = tuple(sorted([i, j]))
@@ -58,21 +60,17 @@ def count_anomalies(ordering: List[int], adjacency_matrix, wrestler_count: int)
     return anomalies
 
 
-def calculate_pagerank_simple(relationships: Dict, wrestlers: Dict[str, Dict]) -> List[Tuple[str, float]]:
+def build_adjacency(relationships: Dict, wrestler_to_idx: Dict[str, int]) -> Dict[int, Dict[int, float]]:
     """
-    Calculate PageRank scores using a simple iterative method.
+    Build the weighted win graph used by PageRank.
     
     Args:
         relationships: Dictionary with direct and common opponent relationships
-        wrestlers: Dictionary of wrestler_id -> wrestler_info
+        wrestler_to_idx: Dictionary of wrestler_id -> matrix index
         
     Returns:
-        List of (wrestler_id, pagerank_score) tuples, sorted by score
+        adjacency[i][j] = weight of wins from wrestler i over wrestler j
     """
-    wrestler_ids = list(wrestlers.keys())
-    wrestler_to_idx = {w_id: i for i, w_id in enumerate(wrestler_ids)}
-    n = len(wrestler_ids)
-    
     # Build adjacency matrix as a dict (wins from i to j)
     adjacency = defaultdict(lambda: defaultdict(float))
     
@@ -148,6 +146,33 @@ def calculate_pagerank_simple(relationships: Dict, wrestlers: Dict[str, Dict]) -
             adjacency[idx2][idx1] += 0.5 * co_wins_2
         # If tied, don't add anything
     
+    return adjacency
+
+
+def calculate_pagerank_simple(
+    relationships: Dict,
+    wrestlers: Dict[str, Dict],
+    adjacency: Optional[Dict[int, Dict[int, float]]] = None
+) -> List[Tuple[str, float]]:
+    """
+    Calculate PageRank scores using a simple iterative method.
+    
+    Args:
+        relationships: Dictionary with direct and common opponent relationships
+        wrestlers: Dictionary of wrestler_id -> wrestler_info
+        adjacency: Prebuilt adjacency (e.g. from the on-disk cache); built
+            from relationships when omitted
+        
+    Returns:
+        List of (wrestler_id, pagerank_score) tuples, sorted by score
+    """
+    wrestler_ids = list(wrestlers.keys())
+    n = len(wrestler_ids)
+    
+    if adjacency is None:
+        wrestler_to_idx = {w_id: i for i, w_id in enumerate(wrestler_ids)}
+        adjacency = build_adjacency(relationships, wrestler_to_idx)
+    
     # Calculate PageRank using power iteration
     damping = 0.85
     max_iter = 100
@@ -159,17 +184,18 @@ def calculate_pagerank_simple(relationships: Dict, wrestlers: Dict[str, Dict]) -
     # Calculate out-degree for each node
     out_degree = [sum(adjacency[i].values()) for i in range(n)]
     
+    # Dangling nodes (no out-edges) distribute their mass evenly; rather than
+    # an O(n) loop per dangling node, fold their total into one scalar.
+    dangling = [i for i in range(n) if out_degree[i] <= 0]
+    linked = [i for i in range(n) if out_degree[i] > 0]
+    
     for iteration in range(max_iter):
-        pr_new = [(1 - damping) / n] * n
+        dangling_mass = damping * sum(pr[i] for i in dangling) / n
+        pr_new = [(1 - damping) / n + dangling_mass] * n
         
-        for i in range(n):
-            if out_degree[i] > 0:
-                for j, weight in adjacency[i].items():
-                    pr_new[j] += damping * pr[i] * (weight / out_degree[i])
-            else:
-                # Dangling node - distribute evenly
-                for j in range(n):
-                    pr_new[j] += damping * pr[i] / n
+        for i in linked:
+            for j, weight in adjacency[i].items():
+                pr_new[j] += damping * pr[i] * (weight / out_degree[i])
         
         # Check convergence
         diff = sum(abs(pr_new[i] - pr[i]) for i in range(n))
@@ -237,6 +263,7 @@ def calculate_rankings_for_weight_class(
         List of ranking dictionaries with wrestler info and rank
     """
     wrestlers = relationships_data['wrestlers']
+    adjacency = relationships_data.get('adjacency')
     relationships = {
         'direct_relationships': relationships_data.get('direct_relationships', {}),
         'common_opponent_relationships': relationships_data.get('common_opponent_relationships', {})
@@ -244,7 +271,7 @@ def calculate_rankings_for_weight_class(
     
     if algorithm == 'pagerank':
         # Use PageRank
-        ranked_scores = calculate_pagerank_simple(relationships, wrestlers)
+        ranked_scores = calculate_pagerank_simple(relationships, wrestlers, adjacency)
         rankings = []
         for rank, (wrestler_id, score) in enumerate(ranked_scores, 1):
             wrestler = wrestlers[wrestler_id]
@@ -275,13 +302,84 @@ def calculate_rankings_for_weight_class(
     return rankings
 
 
-def load_relationships(season: int, data_dir: str = "mt/rankings_data") -> Dict[str, Dict]:
+def adjacency_cache_path(rel_file: Path) -> Path:
+    """
+    Cache file for a relationships JSON, keyed by the source file's mtime and
+    size so edits (or a rebuild) invalidate it automatically.
+    """
+    stat = rel_file.stat()
+    key = hashlib.md5(
+        f"{rel_file.name}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    ).hexdigest()[:12]
+    return rel_file.parent / "cache" / f"{rel_file.stem}_{key}.npz"
+
+
+def save_adjacency_cache(cache_file: Path, relationships_data: Dict) -> Dict:
+    """
+    Build the PageRank adjacency for one weight class and persist it (as COO
+    edge arrays plus the wrestler table) to cache_file.
+    
+    Returns:
+        The slim {'wrestlers', 'adjacency'} dict used for ranking
+    """
+    wrestlers = relationships_data['wrestlers']
+    wrestler_to_idx = {w_id: i for i, w_id in enumerate(wrestlers.keys())}
+    adjacency = build_adjacency(relationships_data, wrestler_to_idx)
+    
+    src, dst, weight = [], [], []
+    for i, row in adjacency.items():
+        for j, w in row.items():
+            src.append(i)
+            dst.append(j)
+            weight.append(w)
+    
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Drop caches for older versions of the same source file
+    stem = cache_file.stem.rsplit('_', 1)[0]
+    for stale in cache_file.parent.glob(f"{stem}_*.npz"):
+        stale.unlink()
+    np.savez(
+        cache_file,
+        src=np.asarray(src, dtype=np.int32),
+        dst=np.asarray(dst, dtype=np.int32),
+        weight=np.asarray(weight, dtype=np.float64),
+        wrestlers=np.array(json.dumps(wrestlers)),
+    )
+    return {'wrestlers': wrestlers, 'adjacency': adjacency}
+
+
+def load_adjacency_cache(cache_file: Path) -> Dict:
+    """
+    Load a cache written by save_adjacency_cache.
+    
+    Returns:
+        Dictionary with 'wrestlers' and a prebuilt 'adjacency'
+    """
+    with np.load(cache_file) as cached:
+        wrestlers = json.loads(str(cached['wrestlers']))
+        adjacency = defaultdict(lambda: defaultdict(float))
+        for i, j, w in zip(cached['src'].tolist(), cached['dst'].tolist(), cached['weight'].tolist()):
+            adjacency[i][j] += w
+    return {'wrestlers': wrestlers, 'adjacency': adjacency}
+
+
+def load_relationships(
+    season: int,
+    data_dir: str = "mt/rankings_data",
+    use_cache: bool = True
+) -> Dict[str, Dict]:
     """
     Load relationship data for all weight classes.
     
+    When numpy is available and use_cache is set, each weight class's adjacency
+    is cached next to the source files (cache/relationships_{weight}_{key}.npz).
+    A warm cache skips JSON parsing entirely and returns slim dicts holding
+    'wrestlers' and a prebuilt 'adjacency' instead of the raw relationships.
+    
     Args:
         season: Season year
         data_dir: Directory containing relationship files
+        use_cache: Read/write the on-disk adjacency cache
         
     Returns:
         Dictionary mapping weight_class -> relationships_data
@@ -291,12 +389,23 @@ def load_relationships(season: int, data_dir: str = "mt/rankings_data") -> Dict[
     if not data_path.exists():
         raise FileNotFoundError(f"Data directory not found: {data_path}")
     
+    use_cache = use_cache and NUMPY_AVAILABLE
     relationships_by_weight = {}
     
     for rel_file in sorted(data_path.glob("relationships_*.json")):
         weight_class = rel_file.stem.replace("relationships_", "")
+        
+        cache_file = adjacency_cache_path(rel_file) if use_cache else None
+        if cache_file is not None and cache_file.exists():
+            relationships_by_weight[weight_class] = load_adjacency_cache(cache_file)
+            continue
+        
         with open(rel_file, 'r', encoding='utf-8') as f:
-            relationships_by_weight[weight_class] = json.load(f)
+            relationships_data = json.load(f)
+        
+        if cache_file is not None:
+            relationships_data = save_adjacency_cache(cache_file, relationships_data)
+        relationships_by_weight[weight_class] = relationships_data
     
     return relationships_by_weight
 
@@ -304,7 +413,8 @@ def load_relationships(season: int, data_dir: str = "mt/rankings_data") -> Dict[
 def calculate_all_rankings(
     season: int,
     algorithm: str = 'pagerank',
-    data_dir: str = "mt/rankings_data"
+    data_dir: str = "mt/rankings_data",
+    use_cache: bool = True
 ) -> Dict[str, List[Dict]]:
     """
     Calculate rankings for all weight classes.
@@ -313,6 +423,7 @@ def calculate_all_rankings(
         season: Season year
         algorithm: Algorithm to use ('pagerank' or 'greedy')
         data_dir: Directory containing relationship files
+        use_cache: Use the on-disk adjacency cache (see load_relationships)
         
     Returns:
         Dictionary mapping weight_class -> list of rankings
@@ -320,7 +431,7 @@ def calculate_all_rankings(
     print(f"Calculating rankings for season {season} using {algorithm} algorithm...")
     
     # Load relationships
-    relationships_by_weight = load_relationships(season, data_dir)
+    relationships_by_weight = load_relationships(season, data_dir, use_cache)
     
     if not relationships_by_weight:
         raise ValueError(f"No relationship data found for season {season}")
@@ -376,9 +487,12 @@ if __name__ == "__main__":
                        help='Ranking algorithm to use')
     parser.add_argument('-data-dir', default='mt/rankings_data', help='Directory containing relationship data')
     parser.add_argument('-save', action='store_true', help='Save rankings to JSON files')
+    parser.add_argument('-no-cache', action='store_true',
+                       help='Ignore the cached adjacency and re-read relationship JSON')
     args = parser.parse_args()
     
-    rankings = calculate_all_rankings(args.season, args.algorithm, args.data_dir)
+    rankings = calculate_all_rankings(args.season, args.algorithm, args.data_dir,
+                                      use_cache=not args.no_cache)
     
     if args.save:
         save_rankings(rankings, args.season, args.data_dir)
@@ -35,18 +35,27 @@ RANKINGS_DIR = Path("mt/rankings_data")
 WEIGHTS = ["125", "133", "141", "149", "157", "165", "174", "184", "197", "285"]
 
 
-def search_teams(teams: List[Dict], query: str) -> List[str]:
-    """Return sorted list of team_name values containing the query."""
-    query_lower = query.lower()
-    names = set()
+def team_name_index(teams: List[Dict]) -> Dict[str, str]:
+    """Map each distinct team_name to its lowercased form, for search_teams."""
+    names: Dict[str, str] = {}
     for team in teams:
         name = team.get("team_name", "Unknown")
-        if query_lower in name.lower():
-            names.add(name)
+        if name not in names:
+            names[name] = name.lower()
+    return names
+
+
+def search_teams(name_index: Dict[str, str], query: str) -> List[str]:
+    """
+    Return sorted list of team_name values containing the query, using the
+    lowercased names from team_name_index.
+    """
+    query_lower = query.lower()
+    names = [name for name, name_lower in name_index.items() if query_lower in name_lower]
     return sorted(names)
 
 
-def prompt_for_team(teams: List[Dict], label: str) -> str:
+def prompt_for_team(name_index: Dict[str, str], label: str) -> str:
     """Interactively prompt for a team by name fragment and return the full name."""
     while True:
         fragment = input(f"Enter name fragment for {label} (e.g. 'Iowa'): ").strip()
@@ -54,7 +63,7 @@ def prompt_for_team(teams: List[Dict], label: str) -> str:
             print("  Please enter at least one character.\n")
             continue
 
-        matches = search_teams(teams, fragment)
+        matches = search_teams(name_index, fragment)
         if not matches:
             print("  No teams found containing that fragment. Try again.\n")
             continue
@@ -94,32 +103,6 @@ def load_rankings_for_weight(
     return data.get("rankings", [])
 
 
-def best_wrestler_for_team_at_weight(
-    rankings: List[Dict], team_name: str
-) -> Optional[Dict]:
-    """
-    Given rankings for a weight, return the entry with the best (lowest) rank
-    for the specified team_name, or None if the team has no ranked wrestler
-    at this weight.
-    """
-    best: Optional[Dict] = None
-    best_rank = 10**9
-    for e in rankings:
-        if e.get("team") != team_name:
-            continue
-        r = e.get("rank")
-        if r is None:
-            continue
-        try:
-            rank_int = int(r)
-        except (TypeError, ValueError):
-            continue
-        if rank_int < best_rank:
-            best_rank = rank_int
-            best = e
-    return best
-
-
 def load_relationships_for_weight(
     season: int, weight: str
 ) -> Optional[Dict]:
@@ -207,21 +190,67 @@ def common_opp_summary(
     return winner, summary
 
 
-def predict_dual_for_weight(
-    season: int,
+def best_by_team_for_weight(rankings: List[Dict]) -> Dict[str, Tuple[int, Dict]]:
+    """
+    Single pass over a weight's rankings: map team -> (rank_int, entry) for
+    that team's best (lowest) ranked wrestler. Entries whose rank is missing
+    or not an integer are skipped.
+    """
+    best: Dict[str, Tuple[int, Dict]] = {}
+    for e in rankings:
+        r = e.get("rank")
+        if r is None:
+            continue
+        try:
+            rank_int = int(r)
+        except (TypeError, ValueError):
+            continue
+        team = e.get("team")
+        cur = best.get(team)
+        if cur is None or rank_int < cur[0]:
+            best[team] = (rank_int, e)
+    return best
+
+
+def precompute_season(season: int) -> Dict[str, Dict]:
+    """
+    Load rankings + relationships for every dual weight exactly once.
+
+    Returns weight -> {
+        "best_by_team": {team_name: (rank_int, entry)},
+        "relationships": relationships dict or None,
+    }
+
+    The result can be reused for any number of predict_dual() calls (e.g. a
+    full round-robin) without touching disk again.
+    """
+    tables: Dict[str, Dict] = {}
+    for weight in WEIGHTS:
+        tables[weight] = {
+            "best_by_team": best_by_team_for_weight(
+                load_rankings_for_weight(season, weight)
+            ),
+            "relationships": load_relationships_for_weight(season, weight),
+        }
+    return tables
+
+
+def predict_weight_from_table(
     weight: str,
     team1: str,
     team2: str,
+    table: Dict,
 ) -> Dict:
     """
-    Compute prediction + notes for a single weight.
+    Compute prediction + notes for a single weight from a precomputed table
+    (see precompute_season). Pure lookups, no I/O.
     Returns a dict with keys:
       weight, w1, w2, w1_rank, w2_rank, winner ("team1"/"team2"/"even"/"none"),
       h2h_note, co_note
     """
-    rankings = load_rankings_for_weight(season, weight)
-    w1 = best_wrestler_for_team_at_weight(rankings, team1)
-    w2 = best_wrestler_for_team_at_weight(rankings, team2)
+    best_by_team = table["best_by_team"]
+    r1, w1 = best_by_team.get(team1, (10**9, None))
+    r2, w2 = best_by_team.get(team2, (10**9, None))
 
     if not w1 and not w2:
         return {
@@ -235,18 +264,6 @@ def predict_dual_for_weight(
             "co_note": "",
         }
 
-    def rank_val(entry: Optional[Dict]) -> int:
-        if not entry:
-            return 10**9
-        r = entry.get("rank")
-        try:
-            return int(r)
-        except (TypeError, ValueError):
-            return 10**8
-
-    r1 = rank_val(w1)
-    r2 = rank_val(w2)
-
     if r1 < r2:
         winner = "team1"
     elif r2 < r1:
@@ -256,7 +273,7 @@ def predict_dual_for_weight(
 
     h2h_note = ""
     co_note = ""
-    rel_data = load_relationships_for_weight(season, weight)
+    rel_data = table["relationships"]
     if rel_data and w1 and w2:
         wid1 = w1["wrestler_id"]
         wid2 = w2["wrestler_id"]
@@ -292,6 +309,35 @@ def predict_dual_for_weight(
     }
 
 
+def predict_dual(team1: str, team2: str, tables: Dict[str, Dict]) -> List[Dict]:
+    """Predict every weight of a dual from precompute_season() tables."""
+    return [
+        predict_weight_from_table(wt, team1, team2, tables[wt])
+        for wt in WEIGHTS
+        if wt in tables
+    ]
+
+
+def predict_dual_for_weight(
+    season: int,
+    weight: str,
+    team1: str,
+    team2: str,
+) -> Dict:
+    """
+    Compute prediction + notes for a single weight, loading its files.
+    Prefer precompute_season() + predict_dual() when predicting more than
+    one weight or more than one dual.
+    """
+    table = {
+        "best_by_team": best_by_team_for_weight(
+            load_rankings_for_weight(season, weight)
+        ),
+        "relationships": load_relationships_for_weight(season, weight),
+    }
+    return predict_weight_from_table(weight, team1, team2, table)
+
+
 def generate_dual_html(
     season: int,
     team1: str,
@@ -437,14 +483,14 @@ def main() -> None:
     teams = load_team_data(season)
     print(f"Loaded {len(teams)} teams for season {season}.\n")
 
-    team1 = prompt_for_team(teams, "Team #1")
-    team2 = prompt_for_team(teams, "Team #2")
+    name_index = team_name_index(teams)
+    team1 = prompt_for_team(name_index, "Team #1")
+    team2 = prompt_for_team(name_index, "Team #2")
 
     print(f"Predicting dual: {team1} vs {team2} (season {season})\n")
 
-    rows: List[Dict] = []
-    for wt in WEIGHTS:
-        rows.append(predict_dual_for_weight(season, wt, team1, team2))
+    tables = precompute_season(season)
+    rows = predict_dual(team1, team2, tables)
 
     if args.output:
         out_path = Path(args.output)
@@ -32,19 +32,164 @@ Behavior:
 from __future__ import annotations
 
 import argparse
+import html
 import json
+import mmap
+import os
+import pickle
+import re
+import sys
 import webbrowser
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is missing: run the kernels as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 
 BONUS_CODES = {"F", "TF", "MD", "INJ", "MFF"}
 FALL_CODES = {"F"}
 FRESHMAN_GRADES = {"Fr.", "RS Fr."}
 
+# Threads used to read/parse per-weight JSON files concurrently
+LOAD_WORKERS = 8
+
+# weight_class_*.json files larger than this are streamed with ijson (when
+# installed), keeping only MATCH_FIELDS from each match
+STREAM_THRESHOLD_BYTES = 10_000_000
+MATCH_FIELDS = ("wrestler1_id", "wrestler2_id", "winner_id", "result")
+
+# JSON files larger than this are mmapped for orjson; smaller ones are cheaper
+# to read directly
+MMAP_THRESHOLD_BYTES = 1_000_000
+
+# Bump when the shape of cached (pickled) data changes, e.g. new derived
+# fields added at load time
+CACHE_VERSION = 4
 
+# Static page head; filled with season/top_n/generated_at (CSS braces doubled)
+HTML_HEAD_TEMPLATE = "\n".join(
+    [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        "<meta charset='utf-8'>",
+        "<title>Freshman of the Year Candidates - Season {season}</title>",
+        "<style>",
+        "body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}",
+        "h1 {{ margin-top: 0; }}",
+        ".meta {{ margin-bottom: 16px; color: #555; }}",
+        "table {{ border-collapse: collapse; width: 100%; font-size: 12px; background-color: #fff; }}",
+        "th, td {{ border: 1px solid #ddd; padding: 6px 8px; text-align: center; }}",
+        "th {{ background-color: #f0f0f0; position: sticky; top: 0; z-index: 2; }}",
+        "thead th {{ white-space: nowrap; }}",
+        "tbody tr:nth-child(even) {{ background-color: #fafafa; }}",
+        "tbody tr:hover {{ background-color: #f1f7ff; }}",
+        ".name-cell {{ text-align: left; }}",
+        ".team-cell {{ text-align: left; }}",
+        "</style>",
+        "</head>",
+        "<body>",
+        "<h1>Freshman of the Year Candidates &mdash; Season {season}</h1>",
+        "<div class='meta'>",
+        "Top {top_n} ranked freshmen per weight class (grades 'Fr.' and 'RS Fr.'). "
+        "Ranked wins and bonus stats computed against current top-33 in the same and adjacent weights. "
+        "Generated at {generated_at}.",
+        "</div>",
+        "<table>",
+        "<thead>",
+        "<tr>",
+        "<th>#</th>",
+        "<th>Name</th>",
+        "<th>Team</th>",
+        "<th>Wt</th>",
+        "<th>W-L</th>",
+        "<th>Win%</th>",
+        "<th>Bonus%</th>",
+        "<th>Pin%</th>",
+        "<th># of Ranked Wins</th>",
+        "<th># of Top 10 Wins</th>",
+        "<th>Ranked Bonus%</th>",
+        "</tr>",
+        "</thead>",
+        "<tbody>",
+    ]
+)
+
+# One <tr> of the HTML report (each row starts on a new line); name/team are
+# passed in already escaped
+HTML_ROW_TEMPLATE = (
+    "\n<tr>"
+    "<td>{idx}</td>"
+    "<td class='name-cell'>{name}</td>"
+    "<td class='team-cell'>{team}</td>"
+    "<td>{s.weight_class}</td>"
+    "<td>{wl}</td>"
+    "<td>{win_pct:.3f}</td>"
+    "<td>{bonus_pct:.3f}</td>"
+    "<td>{fall_pct:.3f}</td>"
+    "<td>{s.ranked_wins}</td>"
+    "<td>{s.top10_wins}</td>"
+    "<td>{ranked_bonus_pct:.3f}</td>"
+    "</tr>"
+)
+HTML_TAIL = "\n</tbody>\n</table>\n</body>\n</html>"
+
+# Column layout of the per-freshman counts matrix built by _tally_matches
+(
+    WINS,
+    LOSSES,
+    BONUS_WINS,
+    FALL_WINS,
+    RANKED_WINS,
+    TOP10_WINS,
+    RANKED_BONUS_WINS,
+) = range(7)
+N_COUNTERS = 7
+
+
+# One compiled pattern for classify_result_type. Each alternative is a
+# lookahead anchored at the start of the string, so the alternatives are tried
+# in priority order (first match wins, not leftmost substring) and the name of
+# the (empty) group that matched is the result code.
+_RESULT_CODE_RE = re.compile(
+    r"^(?:"
+    r"(?=.*(?:mffl|m\. for\.|medical forfeit))(?P<MFF>)"  # Medical forfeit
+    r"|(?=\s*nc\s*\Z|.*no contest)(?P<NC>)"  # No contest
+    r"|(?=.*inj)(?P<INJ>)"  # Injury-related
+    r"|(?=.*(?:fall| pin))(?P<F>)"  # Falls (non-injury)
+    r"|(?=.*(?:tf|technical fall))(?P<TF>)"  # Technical fall
+    r"|(?=.*(?:md|major))(?P<MD>)"  # Major decision
+    r"|(?=.*(?:dec|sv-))(?P<D>)"  # Regular decision (incl. sudden victory)
+    r")",
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=4096)
 def classify_result_type(result: str) -> str:
     """
     Roughly classify a result string into a simple code.
@@ -53,41 +198,11 @@ def classify_result_type(result: str) -> str:
     if not result:
         return "O"
 
-    r = result.lower()
-
-    # Medical forfeit
-    if "mffl" in r or "m. for." in r or "medical forfeit" in r:
-        return "MFF"
-
-    # No contest
-    clean = r.strip()
-    if clean == "nc" or "no contest" in clean:
-        return "NC"
-
-    # Injury-related
-    if "inj" in r or "injury" in r:
-        return "INJ"
+    m = _RESULT_CODE_RE.match(result.lower())
+    return m.lastgroup if m else "O"
 
-    # Falls (non-injury)
-    if "fall" in r or " pin" in r or r.startswith("fall"):
-        return "F"
 
-    # Technical fall
-    if "tf" in r or "technical fall" in r:
-        return "TF"
-
-    # Major decision
-    if "md" in r or "major" in r:
-        return "MD"
-
-    # Regular decision (incl. sudden victory)
-    if "dec" in r or "sv-" in r:
-        return "D"
-
-    return "O"
-
-
-@dataclass
+@dataclass(slots=True)
 class FreshmanStats:
     wrestler_id: str
     name: str
@@ -124,18 +239,265 @@ class FreshmanStats:
         return (self.ranked_bonus_wins / self.ranked_wins) if self.ranked_wins > 0 else 0.0
 
 
+def _safe_ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Elementwise num / den, 0.0 where den == 0."""
+    return np.divide(
+        num, den, out=np.zeros(len(num), dtype=np.float64), where=den > 0
+    )
+
+
+class Candidates:
+    """
+    Column-oriented table of freshman candidates (struct-of-arrays).
+
+    Counters live in one (n, N_COUNTERS) matrix using the _tally_matches
+    column layout; per-wrestler metadata is kept in parallel lists.
+    Percentages and the sort order are computed over whole columns, and
+    FreshmanStats rows are only materialized for printing/HTML.
+    """
+
+    __slots__ = (
+        "wrestler_ids",
+        "names",
+        "teams",
+        "weight_classes",
+        "grades",
+        "weight_rank",
+        "counts",
+    )
+
+    def __init__(
+        self,
+        wrestler_ids: List[str],
+        names: List[str],
+        teams: List[str],
+        weight_classes: List[str],
+        grades: List[str],
+        weight_rank: np.ndarray,
+        counts: np.ndarray,
+    ) -> None:
+        self.wrestler_ids = wrestler_ids
+        self.names = names
+        self.teams = teams
+        self.weight_classes = weight_classes
+        self.grades = grades
+        self.weight_rank = weight_rank
+        self.counts = counts
+
+    @classmethod
+    def empty(cls) -> "Candidates":
+        return cls(
+            [], [], [], [], [],
+            np.zeros(0, dtype=np.int32),
+            np.zeros((0, N_COUNTERS), dtype=np.int32),
+        )
+
+    @classmethod
+    def concat(cls, parts: List["Candidates"]) -> "Candidates":
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        return cls(
+            [x for p in parts for x in p.wrestler_ids],
+            [x for p in parts for x in p.names],
+            [x for p in parts for x in p.teams],
+            [x for p in parts for x in p.weight_classes],
+            [x for p in parts for x in p.grades],
+            np.concatenate([p.weight_rank for p in parts]),
+            np.concatenate([p.counts for p in parts]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.wrestler_ids)
+
+    @property
+    def wins(self) -> np.ndarray:
+        return self.counts[:, WINS]
+
+    @property
+    def ranked_wins(self) -> np.ndarray:
+        return self.counts[:, RANKED_WINS]
+
+    @property
+    def total_matches(self) -> np.ndarray:
+        return self.counts[:, WINS] + self.counts[:, LOSSES]
+
+    @property
+    def win_pct(self) -> np.ndarray:
+        return _safe_ratio(self.counts[:, WINS], self.total_matches)
+
+    @property
+    def bonus_pct(self) -> np.ndarray:
+        return _safe_ratio(self.counts[:, BONUS_WINS], self.wins)
+
+    @property
+    def fall_pct(self) -> np.ndarray:
+        return _safe_ratio(self.counts[:, FALL_WINS], self.wins)
+
+    @property
+    def ranked_bonus_pct(self) -> np.ndarray:
+        return _safe_ratio(self.counts[:, RANKED_BONUS_WINS], self.ranked_wins)
+
+    def sort_order(self) -> np.ndarray:
+        """
+        Indices sorted by:
+          1) overall weight ranking (ascending: rank 1 before 2)
+          2) bonus_pct desc
+          3) ranked_wins desc
+        np.lexsort is stable, so ties keep weight order like list.sort did.
+        """
+        return np.lexsort((-self.ranked_wins, -self.bonus_pct, self.weight_rank))
+
+    def row(self, i: int) -> FreshmanStats:
+        c = self.counts[i]
+        return FreshmanStats(
+            wrestler_id=self.wrestler_ids[i],
+            name=self.names[i],
+            team=self.teams[i],
+            weight_class=self.weight_classes[i],
+            grade=self.grades[i],
+            weight_rank=int(self.weight_rank[i]),
+            wins=int(c[WINS]),
+            losses=int(c[LOSSES]),
+            bonus_wins=int(c[BONUS_WINS]),
+            fall_wins=int(c[FALL_WINS]),
+            ranked_wins=int(c[RANKED_WINS]),
+            top10_wins=int(c[TOP10_WINS]),
+            ranked_bonus_wins=int(c[RANKED_BONUS_WINS]),
+        )
+
+
+def _parse_json_file(path: Path):
+    """
+    Parse a JSON file, with orjson when installed. Files over
+    MMAP_THRESHOLD_BYTES are memory-mapped and handed to orjson as a buffer
+    instead of being read into a bytes copy first.
+    """
+    if orjson is not None and path.stat().st_size > MMAP_THRESHOLD_BYTES:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _stream_weight_class(path: Path) -> Dict:
+    """
+    Stream a large weight_class_*.json with ijson (C backend if available),
+    building the wrestlers dict and slim match dicts (MATCH_FIELDS only)
+    without materializing the full document first.
+    """
+    try:
+        backend = ijson.get_backend("yajl2_c")
+    except ImportError:
+        backend = ijson
+
+    with path.open("rb") as f:
+        wrestlers = dict(backend.kvitems(f, "wrestlers", use_float=True))
+        f.seek(0)
+        matches = [
+            {field: m.get(field) for field in MATCH_FIELDS}
+            for m in backend.items(f, "matches.item", use_float=True)
+        ]
+    return {"wrestlers": wrestlers, "matches": matches}
+
+
+def _parse_weight_class_file(path: Path) -> Dict:
+    """
+    Parse a weight_class_*.json, streaming it if it is very large, and add
+    derived fields once at load time (and, via the pickle cache, once per
+    source file):
+      - each match's result code under "code"
+      - "matches_by_wid": wrestler_id -> indices of the matches they are in
+    """
+    if ijson is not None and path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        data = _stream_weight_class(path)
+    else:
+        data = _parse_json_file(path)
+
+    matches_by_wid: Dict[str, List[int]] = defaultdict(list)
+    for i, m in enumerate(data.get("matches", [])):
+        m["code"] = classify_result_type(m.get("result", "") or "")
+        matches_by_wid[m.get("wrestler1_id")].append(i)
+        matches_by_wid[m.get("wrestler2_id")].append(i)
+    data["matches_by_wid"] = dict(matches_by_wid)
+    return data
+
+
+def _cached_load(path: Path, parse=_parse_json_file):
+    """
+    Parse a JSON file, memoized in a sibling `.pkl` file.
+
+    The pickle is reused only when it was written with the current
+    CACHE_VERSION from a source with the same (mtime_ns, size) as now, so a
+    file replaced by older content (archive restore, `cp -p`, git checkout)
+    still invalidates it. Otherwise the JSON is parsed with `parse` and the
+    pickle is rewritten atomically.
+    """
+    cache_path = path.with_suffix(".pkl")
+    stat = path.stat()
+    source_key = (stat.st_mtime_ns, stat.st_size)
+    try:
+        with cache_path.open("rb") as f:
+            version, key, data = pickle.load(f)
+        if version == CACHE_VERSION and key == source_key:
+            return data
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+
+    data = parse(path)
+
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump(
+                (CACHE_VERSION, source_key, data), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only data dir etc.: caching is best-effort.
+        pass
+    return data
+
+
+def _intern(value):
+    """sys.intern strings (IDs, grades); pass anything else through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_weight_class(wc_data: Dict) -> Dict:
+    """
+    Intern wrestler IDs and grades in a loaded weight class so the hot set/dict
+    lookups on IDs compare by identity.
+    """
+    wrestlers = {}
+    for wid, info in wc_data.get("wrestlers", {}).items():
+        if "grade" in info:
+            info["grade"] = _intern(info["grade"])
+        wrestlers[_intern(wid)] = info
+    wc_data["wrestlers"] = wrestlers
+
+    for m in wc_data.get("matches", []):
+        for key in ("wrestler1_id", "wrestler2_id", "winner_id"):
+            if key in m:
+                m[key] = _intern(m[key])
+    return wc_data
+
+
 def load_weight_classes(season: int, data_dir: str) -> Dict[str, Dict]:
     """Load all `weight_class_*.json` files for a season."""
     base = Path(data_dir) / str(season)
     if not base.exists():
         raise FileNotFoundError(f"Data directory not found: {base}")
 
-    result: Dict[str, Dict] = {}
-    for wc_file in sorted(base.glob("weight_class_*.json")):
-        weight = wc_file.stem.replace("weight_class_", "")
-        with wc_file.open("r", encoding="utf-8") as f:
-            result[weight] = json.load(f)
-    return result
+    wc_files = sorted(base.glob("weight_class_*.json"))
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+        loaded = ex.map(lambda p: _cached_load(p, _parse_weight_class_file), wc_files)
+        return {
+            wc_file.stem.replace("weight_class_", ""): _intern_weight_class(data)
+            for wc_file, data in zip(wc_files, loaded)
+        }
 
 
 def load_grade_overrides(data_dir: str) -> Dict[str, str]:
@@ -147,8 +509,7 @@ def load_grade_overrides(data_dir: str) -> Dict[str, str]:
     if not path.exists():
         return {}
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _cached_load(path)
     except Exception:
         return {}
 
@@ -171,29 +532,85 @@ def load_rankings_for_weight(
     rankings_path = Path(data_dir) / str(season) / f"rankings_{weight}.json"
     if not rankings_path.exists():
         return None
-    with rankings_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("rankings", [])
+    data = _cached_load(rankings_path)
+    rankings = data.get("rankings", [])
+    for entry in rankings:
+        if "wrestler_id" in entry:
+            entry["wrestler_id"] = _intern(entry["wrestler_id"])
+    return rankings
+
+
+@njit(cache=True)
+def _tally_matches(
+    w1_idx,
+    w2_idx,
+    w1_won,
+    w2_won,
+    is_bonus,
+    is_fall,
+    w1_ranked,
+    w2_ranked,
+    w1_top10,
+    w2_top10,
+    n_fresh,
+):
+    """
+    Accumulate per-freshman counters over integer-encoded match columns.
+    w1_idx/w2_idx hold the freshman index of each side, or -1 if that side
+    is not a tracked freshman. Returns an (n_fresh, N_COUNTERS) int32 matrix.
+    """
+    counts = np.zeros((n_fresh, N_COUNTERS), dtype=np.int32)
+    for i in range(w1_idx.shape[0]):
+        bonus = is_bonus[i]
+        fall = is_fall[i]
+
+        # Straight-line update per side; flags are added as 0/1 instead of
+        # branching. Ranked metrics use the opponent on the other side.
+        a = w1_idx[i]
+        if a >= 0:
+            if w1_won[i]:
+                ranked = w2_ranked[i]
+                counts[a, WINS] += 1
+                counts[a, BONUS_WINS] += bonus
+                counts[a, FALL_WINS] += fall
+                counts[a, RANKED_WINS] += ranked
+                counts[a, RANKED_BONUS_WINS] += ranked & bonus
+                counts[a, TOP10_WINS] += ranked & w2_top10[i]
+            else:
+                counts[a, LOSSES] += 1
+
+        b = w2_idx[i]
+        if b >= 0:
+            if w2_won[i]:
+                ranked = w1_ranked[i]
+                counts[b, WINS] += 1
+                counts[b, BONUS_WINS] += bonus
+                counts[b, FALL_WINS] += fall
+                counts[b, RANKED_WINS] += ranked
+                counts[b, RANKED_BONUS_WINS] += ranked & bonus
+                counts[b, TOP10_WINS] += ranked & w1_top10[i]
+            else:
+                counts[b, LOSSES] += 1
+    return counts
 
 
-def compute_stats_for_weight(
-    weight: str,
-    wc_data: Dict,
+def scan_rankings(
     rankings: Optional[List[Dict]],
-    ranked_opponent_ids: Set[str],
-    top10_opponent_ids: Set[str],
-    top_n: int = 10,
-) -> List[FreshmanStats]:
-    """Compute FreshmanStats for top-N ranked freshmen in a single weight."""
-    wrestlers: Dict[str, Dict] = wc_data["wrestlers"]
-    matches: List[Dict] = wc_data["matches"]
-
-    if not rankings:
-        return []
-
-    # Map wrestler_id -> overall rank from rankings file
+    wrestlers: Dict[str, Dict],
+    top_n: int,
+) -> Tuple[Dict[str, int], List[str], FrozenSet[str], FrozenSet[str]]:
+    """
+    Single pass over a weight's rankings. Returns:
+      - rank_by_id: wrestler_id -> overall rank
+      - top_ranked_ids: freshmen whose overall RANK is <= top_n (this mirrors
+        the Hodge script semantics: "top N by rank", then we filter)
+      - top10 / top33: frozensets of IDs ranked within 10 / 33
+    """
     rank_by_id: Dict[str, int] = {}
-    for entry in rankings:
+    top_ranked_ids: List[str] = []
+    top10: Set[str] = set()
+    top33: Set[str] = set()
+    for entry in rankings or []:
         wid = entry.get("wrestler_id")
         rank = entry.get("rank")
         if not wid or rank is None:
@@ -203,87 +620,107 @@ def compute_stats_for_weight(
         except (TypeError, ValueError):
             continue
         rank_by_id[wid] = r
+        if r <= 10:
+            top10.add(wid)
+        if r <= 33:
+            top33.add(wid)
 
-    # Collect wrestler IDs whose overall RANK is <= top_n, but only freshmen.
-    # This mirrors the Hodge script semantics: "top N by rank", then we filter.
-    top_ranked_ids: List[str] = []
-    for entry in rankings:
-        wid = entry.get("wrestler_id")
-        rank = entry.get("rank")
-        if not wid or rank is None:
-            continue
-        if wid not in wrestlers:
-            continue
-        # Only consider wrestlers whose *overall* rank is within top_n
-        try:
-            r = int(rank)
-        except (TypeError, ValueError):
-            continue
-        if r > top_n:
-            continue
+        if (
+            r <= top_n
+            and wid in wrestlers
+            and wrestlers[wid].get("grade", "") in FRESHMAN_GRADES
+        ):
+            top_ranked_ids.append(wid)
 
-        grade = wrestlers[wid].get("grade", "")
-        if grade not in FRESHMAN_GRADES:
-            continue
-        top_ranked_ids.append(wid)
+    return rank_by_id, top_ranked_ids, frozenset(top10), frozenset(top33)
+
+
+def compute_stats_for_weight(
+    weight: str,
+    wc_data: Dict,
+    rank_by_id: Dict[str, int],
+    top_ranked_ids: List[str],
+    ranked_opponent_ids: FrozenSet[str],
+    top10_opponent_ids: FrozenSet[str],
+) -> Candidates:
+    """
+    Compute candidate stats for the top-N ranked freshmen in a single weight,
+    using the rank map and freshman IDs prebuilt by scan_rankings.
+    """
+    wrestlers: Dict[str, Dict] = wc_data["wrestlers"]
+    matches: List[Dict] = wc_data["matches"]
 
     if not top_ranked_ids:
-        return []
-
-    # Initialize stats for those wrestlers
-    stats: Dict[str, FreshmanStats] = {}
-    for wid in top_ranked_ids:
-        info = wrestlers[wid]
-        stats[wid] = FreshmanStats(
-            wrestler_id=wid,
-            name=info.get("name", f"ID:{wid}"),
-            team=info.get("team", "Unknown"),
-            weight_class=weight,
-            grade=info.get("grade", ""),
-            weight_rank=rank_by_id.get(wid, 999),
-        )
+        return Candidates.empty()
 
-    # Iterate matches once and update stats for involved freshmen
-    for m in matches:
-        w1 = m.get("wrestler1_id")
-        w2 = m.get("wrestler2_id")
-        winner = m.get("winner_id")
-        result = m.get("result", "") or ""
-        code = classify_result_type(result)
+    # Dense freshman index for the kernel (-1 = not a tracked freshman)
+    fresh_ids = list(dict.fromkeys(top_ranked_ids))
+    id_to_idx = {wid: i for i, wid in enumerate(fresh_ids)}
 
-        # Only process matches that involve at least one tracked freshman
-        if w1 not in stats and w2 not in stats:
-            continue
+    # Only visit matches involving a tracked freshman, via the inverted index
+    # built at load time (kept in original match order).
+    matches_by_wid: Dict[str, List[int]] = wc_data["matches_by_wid"]
+    relevant = sorted(
+        set().union(*(matches_by_wid.get(wid, ()) for wid in fresh_ids))
+    )
 
-        # Skip NC for win/loss accounting
+    # Encode those matches as parallel columns, skipping NC (it doesn't count
+    # toward the record). Result codes were precomputed at load time.
+    w1_idx: List[int] = []
+    w2_idx: List[int] = []
+    w1_won: List[bool] = []
+    w2_won: List[bool] = []
+    is_bonus: List[bool] = []
+    is_fall: List[bool] = []
+    w1_ranked: List[bool] = []
+    w2_ranked: List[bool] = []
+    w1_top10: List[bool] = []
+    w2_top10: List[bool] = []
+    for i in relevant:
+        m = matches[i]
+        w1 = m.get("wrestler1_id")
+        w2 = m.get("wrestler2_id")
+        a = id_to_idx.get(w1, -1)
+        b = id_to_idx.get(w2, -1)
+        code = m["code"]
         if code == "NC":
             continue
+        winner = m.get("winner_id")
+        w1_idx.append(a)
+        w2_idx.append(b)
+        w1_won.append(winner == w1)
+        w2_won.append(winner == w2)
+        is_bonus.append(code in BONUS_CODES)
+        is_fall.append(code in FALL_CODES)
+        w1_ranked.append(bool(w1) and w1 in ranked_opponent_ids)
+        w2_ranked.append(bool(w2) and w2 in ranked_opponent_ids)
+        w1_top10.append(bool(w1) and w1 in top10_opponent_ids)
+        w2_top10.append(bool(w2) and w2 in top10_opponent_ids)
+
+    counts = _tally_matches(
+        np.array(w1_idx, dtype=np.int32),
+        np.array(w2_idx, dtype=np.int32),
+        np.array(w1_won, dtype=np.bool_),
+        np.array(w2_won, dtype=np.bool_),
+        np.array(is_bonus, dtype=np.bool_),
+        np.array(is_fall, dtype=np.bool_),
+        np.array(w1_ranked, dtype=np.bool_),
+        np.array(w2_ranked, dtype=np.bool_),
+        np.array(w1_top10, dtype=np.bool_),
+        np.array(w2_top10, dtype=np.bool_),
+        len(fresh_ids),
+    )
 
-        def update_for(wid: str, opp_id: Optional[str]) -> None:
-            if wid not in stats:
-                return
-            s = stats[wid]
-            if winner == wid:
-                s.wins += 1
-                if code in BONUS_CODES:
-                    s.bonus_wins += 1
-                if code in FALL_CODES:
-                    s.fall_wins += 1
-
-                # Ranked opponent metrics (current top-33 in same/adjacent weights)
-                if opp_id and opp_id in ranked_opponent_ids:
-                    s.ranked_wins += 1
-                    if code in BONUS_CODES:
-                        s.ranked_bonus_wins += 1
-                    if opp_id in top10_opponent_ids:
-                        s.top10_wins += 1
-            else:
-                s.losses += 1
-
-        update_for(w1, w2)
-        update_for(w2, w1)
-
-    return list(stats.values())
+    infos = [wrestlers[wid] for wid in fresh_ids]
+    return Candidates(
+        wrestler_ids=fresh_ids,
+        names=[info.get("name", f"ID:{wid}") for wid, info in zip(fresh_ids, infos)],
+        teams=[info.get("team", "Unknown") for info in infos],
+        weight_classes=[weight] * len(fresh_ids),
+        grades=[info.get("grade", "") for info in infos],
+        weight_rank=np.array([rank_by_id.get(wid, 999) for wid in fresh_ids], dtype=np.int32),
+        counts=counts,
+    )
 
 
 def main() -> None:
@@ -333,76 +770,66 @@ def main() -> None:
         key=lambda w: int(w),
     )
 
-    # Preload rankings and build top-10 / top-33 sets per weight
-    rankings_by_weight: Dict[str, Optional[List[Dict]]] = {}
-    top10_ids_by_weight: Dict[str, Set[str]] = {}
-    top33_ids_by_weight: Dict[str, Set[str]] = {}
-
-    for weight in numeric_weights:
-        rankings = load_rankings_for_weight(season, weight, data_dir)
-        rankings_by_weight[weight] = rankings
-        top10: Set[str] = set()
-        top33: Set[str] = set()
-        if rankings:
-            for entry in rankings:
-                wid = entry.get("wrestler_id")
-                rank = entry.get("rank")
-                if not wid or rank is None:
-                    continue
-                try:
-                    r = int(rank)
-                except (TypeError, ValueError):
-                    continue
-                if r <= 10:
-                    top10.add(wid)
-                if r <= 33:
-                    top33.add(wid)
-        top10_ids_by_weight[weight] = top10
-        top33_ids_by_weight[weight] = top33
-
-    all_candidates: List[FreshmanStats] = []
+    # Preload rankings and, in the same pass, build the rank map, top-N
+    # freshman IDs and top-10 / top-33 sets per weight
+    rank_by_id_by_weight: Dict[str, Dict[str, int]] = {}
+    top_freshman_ids_by_weight: Dict[str, List[str]] = {}
+    top10_ids_by_weight: Dict[str, FrozenSet[str]] = {}
+    top33_ids_by_weight: Dict[str, FrozenSet[str]] = {}
+
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+        loaded_rankings = list(
+            ex.map(lambda w: load_rankings_for_weight(season, w, data_dir), numeric_weights)
+        )
+
+    for weight, rankings in zip(numeric_weights, loaded_rankings):
+        (
+            rank_by_id_by_weight[weight],
+            top_freshman_ids_by_weight[weight],
+            top10_ids_by_weight[weight],
+            top33_ids_by_weight[weight],
+        ) = scan_rankings(rankings, wc_by_weight[weight].get("wrestlers", {}), args.top_n)
+
+    candidate_parts: List[Candidates] = []
 
     # For each weight, build the set of ranked/top10 opponent IDs from
     # the current and adjacent weight classes only.
     for idx, weight in enumerate(numeric_weights):
-        wc_data = wc_by_weight[weight]
-        rankings = rankings_by_weight.get(weight)
-        if not rankings:
+        # Weights without a top-N freshman skip opponent-set assembly and
+        # tallying entirely.
+        top_freshman_ids = top_freshman_ids_by_weight[weight]
+        if not top_freshman_ids:
             continue
 
-        neighbor_weights = [weight]
-        if idx > 0:
-            neighbor_weights.append(numeric_weights[idx - 1])
-        if idx < len(numeric_weights) - 1:
-            neighbor_weights.append(numeric_weights[idx + 1])
+        prev_weight = numeric_weights[idx - 1] if idx > 0 else None
+        next_weight = numeric_weights[idx + 1] if idx < len(numeric_weights) - 1 else None
+        empty: FrozenSet[str] = frozenset()
 
-        ranked_ids: Set[str] = set()
-        top10_ids: Set[str] = set()
-        for w in neighbor_weights:
-            ranked_ids.update(top33_ids_by_weight.get(w, set()))
-            top10_ids.update(top10_ids_by_weight.get(w, set()))
+        ranked_ids = (
+            top33_ids_by_weight[weight]
+            | top33_ids_by_weight.get(prev_weight, empty)
+            | top33_ids_by_weight.get(next_weight, empty)
+        )
+        top10_ids = (
+            top10_ids_by_weight[weight]
+            | top10_ids_by_weight.get(prev_weight, empty)
+            | top10_ids_by_weight.get(next_weight, empty)
+        )
 
         stats = compute_stats_for_weight(
             weight,
-            wc_data,
-            rankings,
+            wc_by_weight[weight],
+            rank_by_id_by_weight[weight],
+            top_freshman_ids,
             ranked_ids,
             top10_ids,
-            top_n=args.top_n,
         )
-        all_candidates.extend(stats)
-
-    # Sort across all weights:
-    # 1) overall weight ranking (ascending: rank 1 before 2)
-    # 2) bonus_pct desc
-    # 3) ranked_wins desc
-    all_candidates.sort(
-        key=lambda s: (
-            s.weight_rank,
-            -s.bonus_pct,
-            -s.ranked_wins,
-        )
-    )
+        candidate_parts.append(stats)
+
+    # Sort across all weights (see Candidates.sort_order), then materialize
+    # rows only for the formatting stage below.
+    candidates = Candidates.concat(candidate_parts)
+    all_candidates = [candidates.row(i) for i in candidates.sort_order()]
 
     print(
         f"\nFreshman of the Year candidate metrics for season {season} "
@@ -431,81 +858,29 @@ def main() -> None:
 
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    html = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        "<meta charset='utf-8'>",
-        f"<title>Freshman of the Year Candidates - Season {season}</title>",
-        "<style>",
-        "body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }",
-        "h1 { margin-top: 0; }",
-        ".meta { margin-bottom: 16px; color: #555; }",
-        "table { border-collapse: collapse; width: 100%; font-size: 12px; background-color: #fff; }",
-        "th, td { border: 1px solid #ddd; padding: 6px 8px; text-align: center; }",
-        "th { background-color: #f0f0f0; position: sticky; top: 0; z-index: 2; }",
-        "thead th { white-space: nowrap; }",
-        "tbody tr:nth-child(even) { background-color: #fafafa; }",
-        "tbody tr:hover { background-color: #f1f7ff; }",
-        ".name-cell { text-align: left; }",
-        ".team-cell { text-align: left; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        f"<h1>Freshman of the Year Candidates &mdash; Season {season}</h1>",
-        "<div class='meta'>",
-        f"Top {args.top_n} ranked freshmen per weight class (grades 'Fr.' and 'RS Fr.'). "
-        "Ranked wins and bonus stats computed against current top-33 in the same and adjacent weights. "
-        f"Generated at {generated_at}.",
-        "</div>",
-        "<table>",
-        "<thead>",
-        "<tr>",
-        "<th>#</th>",
-        "<th>Name</th>",
-        "<th>Team</th>",
-        "<th>Wt</th>",
-        "<th>W-L</th>",
-        "<th>Win%</th>",
-        "<th>Bonus%</th>",
-        "<th>Pin%</th>",
-        "<th># of Ranked Wins</th>",
-        "<th># of Top 10 Wins</th>",
-        "<th>Ranked Bonus%</th>",
-        "</tr>",
-        "</thead>",
-        "<tbody>",
-    ]
-
-    for idx, s in enumerate(all_candidates, start=1):
-        wl = f"{s.wins}-{s.losses}"
-        html.append(
-            "<tr>"
-            f"<td>{idx}</td>"
-            f"<td class='name-cell'>{s.name}</td>"
-            f"<td class='team-cell'>{s.team}</td>"
-            f"<td>{s.weight_class}</td>"
-            f"<td>{wl}</td>"
-            f"<td>{s.win_pct:.3f}</td>"
-            f"<td>{s.bonus_pct:.3f}</td>"
-            f"<td>{s.fall_pct:.3f}</td>"
-            f"<td>{s.ranked_wins}</td>"
-            f"<td>{s.top10_wins}</td>"
-            f"<td>{s.ranked_bonus_pct:.3f}</td>"
-            "</tr>"
-        )
-
-    html.extend(
-        [
-            "</tbody>",
-            "</table>",
-            "</body>",
-            "</html>",
-        ]
-    )
-
+    # Stream straight to the file from the precompiled templates: head, one
+    # write per row, then the tail.
     with html_path.open("w", encoding="utf-8") as f:
-        f.write("\n".join(html))
+        f.write(
+            HTML_HEAD_TEMPLATE.format(
+                season=season, top_n=args.top_n, generated_at=generated_at
+            )
+        )
+        for idx, s in enumerate(all_candidates, start=1):
+            f.write(
+                HTML_ROW_TEMPLATE.format(
+                    idx=idx,
+                    s=s,
+                    name=html.escape(s.name),
+                    team=html.escape(s.team),
+                    wl=f"{s.wins}-{s.losses}",
+                    win_pct=s.win_pct,
+                    bonus_pct=s.bonus_pct,
+                    fall_pct=s.fall_pct,
+                    ranked_bonus_pct=s.ranked_bonus_pct,
+                )
+            )
+        f.write(HTML_TAIL)
 
     print(f"\nHTML Freshman report written to {html_path}\n")
     try:
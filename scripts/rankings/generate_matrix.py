@@ -6,12 +6,31 @@ This script creates an interactive HTML matrix where you can manually
 adjust wrestler rankings and save them to JSON files.
 """
 
+import gzip
+import html
+import io
 import json
+import os
 import re
 import shutil
-from datetime import datetime, date, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Compact JSON text for embedding in the page (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
 
 def abbreviate_name(full_name: str) -> str:
@@ -29,6 +48,7 @@ def abbreviate_name(full_name: str) -> str:
     return f"{first_initial}. {last}"
 
 
+@lru_cache(maxsize=4096)
 def parse_match_date(date_str: str) -> date | None:
     """Parse a match date in MM/DD/YYYY form to a date object."""
     if not date_str:
@@ -46,10 +66,43 @@ def is_recent_date(date_str: str, today: date, days: int = 7) -> bool:
     d = parse_match_date(date_str)
     if not d:
         return False
-    delta = today - d
-    return timedelta(0) <= delta <= timedelta(days=days)
+    delta = today.toordinal() - d.toordinal()
+    return 0 <= delta <= days
+
+
+def recent_date_strings(date_strs, today: date, days: int = 7) -> frozenset:
+    """
+    Return the subset of date strings that fall within the last `days` days.
+
+    Each distinct string is parsed once, so callers can replace repeated
+    is_recent_date() calls with a set membership test.
+    """
+    return frozenset(
+        s for s in set(date_strs) if s and is_recent_date(s, today, days)
+    )
 
 
+# Result classifier as a single start-anchored pattern. Each alternative is
+# a lookahead over the whole string, tried in the same priority order as
+# the original chain of substring checks, and the (empty) named group that
+# fires identifies the code. Matching is case-insensitive, so callers pass
+# the raw result string without lowercasing it first.
+_RESULT_CODE_RE = re.compile(
+    r"^(?:"
+    r"(?=.*(?:mffl|m\. for\.|medical forfeit))(?P<MFF>)"  # Medical forfeit
+    r"|(?=\s*nc\s*\Z|.*no contest)(?P<NC>)"  # No contest
+    r"|(?=.*inj)(?P<INJ>)"  # Injury-related
+    r"|(?=.*(?:fall| pin))(?P<F>)"  # Falls (non-injury)
+    r"|(?=.*(?:tf|technical fall))(?P<TF>)"  # Technical fall
+    r"|(?=.*(?:md|major))(?P<MD>)"  # Major decision
+    r"|(?=.*(?:tb-|tiebreak))(?P<TB>)"  # Tiebreaker decision (e.g. "TB-1 9-8")
+    r"|(?=.*(?:dec|sv-))(?P<D>)"  # Regular decision (incl. sudden victory)
+    r")",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
 def classify_result_type(result: str) -> str:
     """
     Classify a single match result string into a display code.
@@ -61,47 +114,36 @@ def classify_result_type(result: str) -> str:
         - TF  : Technical Fall
         - F   : Fall (pin)
         - INJ : Injury-related (injury fall/default)
+        - MFF : Medical forfeit
+        - NC  : No contest
         - O   : Other / unknown
     """
     if not result:
         return "O"
     
-    r = result.lower()
-    
-    # Medical forfeit (scraped as "MFFL" or "M. For.")
-    if "mffl" in r or "m. for." in r or "medical forfeit" in r:
-        return "MFF"
-    
-    # No contest
-    clean = r.strip()
-    if clean == "nc" or "no contest" in clean:
-        return "NC"
-    
-    # Injury-related first
-    if "inj" in r or "injury" in r:
-        return "INJ"
-    
-    # Falls (but not injury falls)
-    if "fall" in r or " pin" in r or r.startswith("fall"):
-        return "F"
-    
-    # Technical fall
-    if "tf" in r or "technical fall" in r:
-        return "TF"
-    
-    # Major decision
-    if "md" in r or "major" in r:
-        return "MD"
-    
-    # Tiebreaker decision (e.g., "TB-1 9-8")
-    if "tb-" in r or "tiebreak" in r:
-        return "TB"
-    
-    # Regular decision (including sudden victory)
-    if "dec" in r or "sv-" in r:
-        return "D"
-    
-    return "O"
+    m = _RESULT_CODE_RE.match(result)
+    return m.lastgroup if m else "O"
+
+
+# Lower rank is "better" / more dominant
+_RESULT_RANK = {
+    "F": 0,
+    "TF": 1,
+    "INJ": 2,
+    "MFF": 3,
+    "MD": 4,
+    "TB": 5,
+    "D": 6,
+    "NC": 7,
+    "O": 8
+}
+_RANK_TO_CODE = tuple(_RESULT_RANK)
+
+
+@lru_cache(maxsize=4096)
+def result_rank(result: str) -> int:
+    """Integer dominance rank (see _RESULT_RANK) of a raw result string."""
+    return _RESULT_RANK[classify_result_type(result)]
 
 
 def classify_best_win(matches: List[Dict], winner_id: str) -> str:
@@ -109,34 +151,44 @@ def classify_best_win(matches: List[Dict], winner_id: str) -> str:
     Given a list of match dicts and a winner_id, choose the best
     (most dominant) result type code for that winner.
     """
-    # Lower rank is "better" / more dominant
-    rank_order = {
-        "F": 0,
-        "TF": 1,
-        "INJ": 2,
-        "MFF": 3,
-        "MD": 4,
-        "TB": 5,
-        "D": 6,
-        "NC": 7,
-        "O": 8
-    }
-    
-    best_code = "O"
-    best_rank = rank_order[best_code]
-    
-    for m in matches:
-        if m.get("winner_id") != winner_id:
-            continue
-        code = classify_result_type(m.get("result", ""))
-        rank = rank_order.get(code, rank_order["O"])
-        if rank < best_rank:
-            best_code = code
-            best_rank = rank
-    
-    return best_code
+    best_rank = min(
+        (
+            result_rank(m.get("result", ""))
+            for m in matches
+            if m.get("winner_id") == winner_id
+        ),
+        default=_RESULT_RANK["O"],
+    )
+    return _RANK_TO_CODE[best_rank]
 
 
+def best_win_codes(matches: List[Dict]) -> Dict[str, str]:
+    """
+    Single pass over a series' matches returning winner_id -> best code,
+    i.e. classify_best_win() for every winner at once.
+    """
+    best: Dict[str, int] = {}
+    for m in matches:
+        winner_id = m.get("winner_id")
+        rank = result_rank(m.get("result", ""))
+        if rank < best.get(winner_id, len(_RANK_TO_CODE)):
+            best[winner_id] = rank
+    return {winner_id: _RANK_TO_CODE[rank] for winner_id, rank in best.items()}
+
+
+# Result code -> cell severity. Regular decisions, TB tiebreakers and
+# anything unknown fall through to the light decision shading.
+_SEVERITY = {
+    "NC": "nc",
+    "MFF": "nc",
+    "INJ": "co",
+    "F": "strong",
+    "TF": "strong",
+    "MD": "medium",
+}
+
+
+@lru_cache(maxsize=4096)
 def severity_for_result_code(code: str) -> str:
     """
     Map a result code to a severity level for cell shading.
@@ -147,18 +199,14 @@ def severity_for_result_code(code: str) -> str:
     - co     : Injury (INJ), styled like common opponents
     - nc     : No contest (NC) / Medical Forfeit (MFF), neutral grey for both wrestlers
     """
-    if code in ("NC", "MFF"):
-        return "nc"
-    if code == "INJ":
-        return "co"
-    if code in ("F", "TF"):
-        return "strong"
-    if code == "MD":
-        return "medium"
-    # Regular decisions and TB tiebreakers share the same light decision shading
-    return "light"
+    return _SEVERITY.get(code, "light")
+
+
+# Score such as "3-2" inside a raw result string
+_SCORE_RE = re.compile(r"(\d+-\d+)")
 
 
+@lru_cache(maxsize=2048)
 def format_result_for_tooltip(result: str) -> str:
     """
     Format a raw result string into a readable phrase for tooltips.
@@ -174,7 +222,7 @@ def format_result_for_tooltip(result: str) -> str:
     
     code = classify_result_type(result)
     # Try to pull out a score like "3-2"
-    score_match = re.search(r"(\\d+-\\d+)", result)
+    score_match = _SCORE_RE.search(result)
     score = score_match.group(1) if score_match else ""
     
     if code == "F":
@@ -197,6 +245,20 @@ def format_result_for_tooltip(result: str) -> str:
     return result.strip()
 
 
+@dataclass(slots=True)
+class CellData:
+    """One non-empty matrix cell, oriented from the row wrestler's side."""
+    type: str
+    value: str
+    tooltip: str
+    severity: Optional[str] = None
+    recent: bool = False
+    matches: Optional[List[Dict]] = None
+    co_details: Optional[List[Dict]] = None
+    co_winner: Optional[str] = None
+    co_loser: Optional[str] = None
+
+
 def build_matrix_data(
     relationships_data: Dict, placement_notes: Optional[Dict[str, str]] = None
 ) -> Dict:
@@ -207,7 +269,11 @@ def build_matrix_data(
         relationships_data: Dictionary with wrestlers and relationships
         
     Returns:
-        Dictionary with matrix data for HTML generation
+        Dictionary with matrix data for HTML generation: 'wrestlers' in
+        display order and 'matrix', an N x N list where matrix[i][j] is the
+        CellData for row wrestler i vs column wrestler j (None if the pair
+        has no relationship), plus parallel per-wrestler lists 'ids',
+        'names', 'wins', 'losses' and 'is_unranked' in the same order
     """
     wrestlers = relationships_data['wrestlers']
     direct_rels = relationships_data.get('direct_relationships', {})
@@ -285,28 +351,64 @@ def build_matrix_data(
         else:
             winfo["is_starter"] = False
     
-    # Build matrix
-    matrix = {}
+    # Index relationships by each endpoint so the matrix build only visits
+    # pairs that actually have a relationship instead of all N² pairs.
+    # Direct series are visited from both rows, so each one's best win code
+    # per winner is worked out once here.
+    direct_by_wrestler: Dict[str, Dict[str, str]] = {}
+    best_by_winner: Dict[str, Dict[str, str]] = {}
+    for pair_key_str, rel in direct_rels.items():
+        direct_by_wrestler.setdefault(rel['wrestler1_id'], {})[rel['wrestler2_id']] = pair_key_str
+        direct_by_wrestler.setdefault(rel['wrestler2_id'], {})[rel['wrestler1_id']] = pair_key_str
+        best_by_winner[pair_key_str] = best_win_codes(rel.get('matches', []))
+    co_by_wrestler: Dict[str, Dict[str, str]] = {}
+    for pair_key_str, rel in co_rels.items():
+        co_by_wrestler.setdefault(rel['wrestler1_id'], {})[rel['wrestler2_id']] = pair_key_str
+        co_by_wrestler.setdefault(rel['wrestler2_id'], {})[rel['wrestler1_id']] = pair_key_str
+    # Hot per-wrestler fields as parallel lists (shared with the renderer)
+    ids = [wid for wid, _ in wrestler_list]
+    names = [winfo['name'] for _, winfo in wrestler_list]
+    wins = [winfo.get('wins', 0) or 0 for _, winfo in wrestler_list]
+    losses = [winfo.get('losses', 0) or 0 for _, winfo in wrestler_list]
+    is_unranked = [bool(winfo.get('is_unranked')) for _, winfo in wrestler_list]
+    index_by_id = {wid: idx for idx, wid in enumerate(ids)}
+
+    # Build matrix as an N x N grid indexed like the returned wrestler list.
+    # Pairs without a relationship stay None; renderers treat that as an
+    # empty cell.
+    n = len(wrestler_list)
+    matrix: List[List[Optional[Dict]]] = [[None] * n for _ in range(n)]
     today = datetime.today().date()
+
+    # Parse every match date once up front; the cell loop below only needs
+    # a membership test against the dates that are recent.
+    all_dates = []
+    for rel in direct_rels.values():
+        all_dates.extend(m.get('date', '') for m in rel.get('matches', []))
+    for rel in co_rels.values():
+        for detail in rel.get('co_details_1', []) + rel.get('co_details_2', []):
+            all_dates.append(detail.get('winner_match', {}).get('date', ''))
+            all_dates.append(detail.get('loser_match', {}).get('date', ''))
+    recent_dates = recent_date_strings(all_dates, today)
     
-    for i, (w1_id, w1_info) in enumerate(wrestler_list):
-        for j, (w2_id, w2_info) in enumerate(wrestler_list):
-            if i == j:
+    for i, w1_id in enumerate(ids):
+        w1_name = names[i]
+        direct_for_w1 = direct_by_wrestler.get(w1_id, {})
+        co_for_w1 = co_by_wrestler.get(w1_id, {})
+        related_ids = list(direct_for_w1)
+        related_ids.extend(w2_id for w2_id in co_for_w1 if w2_id not in direct_for_w1)
+
+        for w2_id in related_ids:
+            j = index_by_id.get(w2_id)
+            if j is None or j == i:
                 continue
-            
-            # Create normalized pair key
-            pair_key = tuple(sorted([w1_id, w2_id]))
-            pair_key_str = f"{pair_key[0]}_{pair_key[1]}"
-            
-            cell_data = {
-                'type': 'none',
-                'value': '',
-                'tooltip': ''
-            }
+            w2_name = names[j]
             
             # Check direct relationships
-            if pair_key_str in direct_rels:
+            if w2_id in direct_for_w1:
+                pair_key_str = direct_for_w1[w2_id]
                 rel = direct_rels[pair_key_str]
+                best_codes = best_by_winner[pair_key_str]
                 wins_1 = rel.get('direct_wins_1', 0)
                 wins_2 = rel.get('direct_wins_2', 0)
                 matches = rel.get('matches', [])
@@ -316,15 +418,17 @@ def build_matrix_data(
                 # Even series where both wrestlers have wins (e.g. 1-1, 2-2):
                 # show neutral split "S" cell in both directions (yellow).
                 if total_matches >= 2 and has_wins_both and wins_1 == wins_2:
-                    cell_data['type'] = 'split_even'
-                    cell_data['value'] = 'S'
-                    cell_data['tooltip'] = (
-                        f"{w1_info['name']} and {w2_info['name']} are split head-to-head "
-                        f"({wins_1}-{wins_2})"
-                    )
-                    cell_data['matches'] = matches
-                    cell_data['recent'] = any(
-                        is_recent_date(m.get('date', ''), today) for m in matches
+                    matrix[i][j] = CellData(
+                        type='split_even',
+                        value='S',
+                        tooltip=(
+                            f"{w1_name} and {w2_name} are split head-to-head "
+                            f"({wins_1}-{wins_2})"
+                        ),
+                        matches=matches,
+                        recent=any(
+                            m.get('date', '') in recent_dates for m in matches
+                        ),
                     )
                 else:
                     # Non-even series.
@@ -335,250 +439,178 @@ def build_matrix_data(
                     #   show an "S" in the advantaged direction, with green/red shading based on
                     #   the best win.
                     use_series_S = total_matches >= 3 and has_wins_both and wins_1 != wins_2
+                    # Orient the series counts from w1's point of view.
                     if w1_id == rel['wrestler1_id']:
-                        if wins_1 > wins_2:
-                            # w1 has direct advantage
-                            code = classify_best_win(matches, w1_id)
-                            cell_data['type'] = 'direct_win'
-                            cell_data['value'] = 'S' if use_series_S else code
-                            cell_data['tooltip'] = (
-                                f"{w1_info['name']} leads head-to-head over "
-                                f"{w2_info['name']} ({wins_1}-{wins_2})"
-                            )
-                            cell_data['severity'] = severity_for_result_code(code)
-                            cell_data['matches'] = matches
-                            # Recent highlight: direct matches within the last week
-                            cell_data['recent'] = any(
-                                is_recent_date(m.get('date', ''), today) for m in matches
-                            )
-                        elif wins_2 > wins_1:
-                            # w2 has direct advantage
-                            code = classify_best_win(matches, rel['wrestler2_id'])
-                            cell_data['type'] = 'direct_loss'
-                            cell_data['value'] = 'S' if use_series_S else code
-                            cell_data['tooltip'] = (
-                                f"{w2_info['name']} leads head-to-head over "
-                                f"{w1_info['name']} ({wins_2}-{wins_1})"
-                            )
-                            cell_data['severity'] = severity_for_result_code(code)
-                            cell_data['matches'] = matches
-                            cell_data['recent'] = any(
-                                is_recent_date(m.get('date', ''), today) for m in matches
-                            )
+                        w1_wins, w2_wins = wins_1, wins_2
                     else:
-                        # w1 is rel['wrestler2_id']
-                        if wins_2 > wins_1:
-                            # w1 has direct advantage (as wrestler2)
-                            code = classify_best_win(matches, w1_id)
-                            cell_data['type'] = 'direct_win'
-                            cell_data['value'] = 'S' if use_series_S else code
-                            cell_data['tooltip'] = (
-                                f"{w1_info['name']} leads head-to-head over "
-                                f"{w2_info['name']} ({wins_2}-{wins_1})"
-                            )
-                            cell_data['severity'] = severity_for_result_code(code)
-                            cell_data['matches'] = matches
-                            cell_data['recent'] = any(
-                                is_recent_date(m.get('date', ''), today) for m in matches
-                            )
-                        elif wins_1 > wins_2:
+                        w1_wins, w2_wins = wins_2, wins_1
+                    if w1_wins != w2_wins:
+                        if w1_wins > w2_wins:
+                            # w1 has direct advantage
+                            cell_type = 'direct_win'
+                            leader_id, leader_name, trailer_name = w1_id, w1_name, w2_name
+                        else:
                             # w2 has direct advantage
-                            code = classify_best_win(matches, rel['wrestler1_id'])
-                            cell_data['type'] = 'direct_loss'
-                            cell_data['value'] = 'S' if use_series_S else code
-                            cell_data['tooltip'] = (
-                                f"{w2_info['name']} leads head-to-head over "
-                                f"{w1_info['name']} ({wins_1}-{wins_2})"
-                            )
-                            cell_data['severity'] = severity_for_result_code(code)
-                            cell_data['matches'] = matches
-                            cell_data['recent'] = any(
-                                is_recent_date(m.get('date', ''), today) for m in matches
-                            )
+                            cell_type = 'direct_loss'
+                            leader_id, leader_name, trailer_name = w2_id, w2_name, w1_name
+                        code = best_codes.get(leader_id, 'O')
+                        matrix[i][j] = CellData(
+                            type=cell_type,
+                            value='S' if use_series_S else code,
+                            tooltip=(
+                                f"{leader_name} leads head-to-head over "
+                                f"{trailer_name} "
+                                f"({max(w1_wins, w2_wins)}-{min(w1_wins, w2_wins)})"
+                            ),
+                            severity=severity_for_result_code(code),
+                            matches=matches,
+                            # Recent highlight: direct matches within the last week
+                            recent=any(
+                                m.get('date', '') in recent_dates for m in matches
+                            ),
+                        )
             
             # Check common opponent relationships (only if no direct relationship)
-            elif pair_key_str in co_rels:
+            else:
+                pair_key_str = co_for_w1[w2_id]
                 rel = co_rels[pair_key_str]
                 co_wins_1 = rel.get('common_opp_wins_1', 0)
                 co_wins_2 = rel.get('common_opp_wins_2', 0)
                 co_details_1 = rel.get('co_details_1', [])
                 co_details_2 = rel.get('co_details_2', [])
                 
-                # Determine which wrestler is which in the relationship
-                # rel['wrestler1_id'] and rel['wrestler2_id'] are the normalized pair
-                rel_w1_id = rel['wrestler1_id']
-                rel_w2_id = rel['wrestler2_id']
-                
-                # Map to our current wrestlers
-                if w1_id == rel_w1_id:
-                    # w1 is wrestler1 in relationship, w2 is wrestler2
-                    if co_wins_1 > co_wins_2:
-                        cell_data['type'] = 'common_win'
-                        cell_data['value'] = "CO"
-                        cell_data['co_details'] = co_details_1
-                        cell_data['co_winner'] = w1_id
-                        cell_data['co_loser'] = w2_id
-                        cell_data['severity'] = 'co'
-                        cell_data['tooltip'] = f"{w1_info['name']} has common opponent win(s) over {w2_info['name']}"
-                    elif co_wins_2 > co_wins_1:
-                        cell_data['type'] = 'common_loss'
-                        cell_data['value'] = "CO"
-                        cell_data['co_details'] = co_details_2
-                        cell_data['co_winner'] = w2_id
-                        cell_data['co_loser'] = w1_id
-                        cell_data['severity'] = 'co'
-                        cell_data['tooltip'] = f"{w2_info['name']} has common opponent win(s) over {w1_info['name']}"
+                # Orient the counts from w1's point of view; rel['wrestler1_id']
+                # and rel['wrestler2_id'] are the normalized pair
+                if w1_id == rel['wrestler1_id']:
+                    w1_co_wins, w2_co_wins = co_wins_1, co_wins_2
+                    w1_details, w2_details = co_details_1, co_details_2
                 else:
-                    # w1 is wrestler2 in relationship, w2 is wrestler1
-                    if co_wins_2 > co_wins_1:
-                        cell_data['type'] = 'common_win'
-                        cell_data['value'] = "CO"
-                        cell_data['co_details'] = co_details_2
-                        cell_data['co_winner'] = w1_id
-                        cell_data['co_loser'] = w2_id
-                        cell_data['severity'] = 'co'
-                        cell_data['tooltip'] = f"{w1_info['name']} has common opponent win(s) over {w2_info['name']}"
-                    elif co_wins_1 > co_wins_2:
-                        cell_data['type'] = 'common_loss'
-                        cell_data['value'] = "CO"
-                        cell_data['co_details'] = co_details_1
-                        cell_data['co_winner'] = w2_id
-                        cell_data['co_loser'] = w1_id
-                        cell_data['severity'] = 'co'
-                        cell_data['tooltip'] = f"{w2_info['name']} has common opponent win(s) over {w1_info['name']}"
-            
-            # For common-opponent cells, check if any underlying match is recent
-            if cell_data.get('co_details'):
+                    w1_co_wins, w2_co_wins = co_wins_2, co_wins_1
+                    w1_details, w2_details = co_details_2, co_details_1
+
+                # Balanced records leave the cell empty
+                if w1_co_wins == w2_co_wins:
+                    continue
+                if w1_co_wins > w2_co_wins:
+                    cell_type, co_details = 'common_win', w1_details
+                    winner_id, loser_id = w1_id, w2_id
+                    winner_name, loser_name = w1_name, w2_name
+                else:
+                    cell_type, co_details = 'common_loss', w2_details
+                    winner_id, loser_id = w2_id, w1_id
+                    winner_name, loser_name = w2_name, w1_name
+
+                # Recent if any underlying match is within the last week
                 recent_any = False
-                for detail in cell_data['co_details']:
+                for detail in co_details:
                     wm = detail.get('winner_match', {})
                     lm = detail.get('loser_match', {})
-                    if is_recent_date(wm.get('date', ''), today) or is_recent_date(
-                        lm.get('date', ''), today
-                    ):
+                    if wm.get('date', '') in recent_dates or lm.get('date', '') in recent_dates:
                         recent_any = True
                         break
-                cell_data['recent'] = recent_any
-            
-            matrix[f"{w1_id}_{w2_id}"] = cell_data
+                matrix[i][j] = CellData(
+                    type=cell_type,
+                    value="CO",
+                    tooltip=f"{winner_name} has common opponent win(s) over {loser_name}",
+                    severity='co',
+                    recent=recent_any,
+                    co_details=co_details,
+                    co_winner=winner_id,
+                    co_loser=loser_id,
+                )
     
     return {
         'wrestlers': [{'id': w_id, **w_info} for w_id, w_info in wrestler_list],
-        'matrix': matrix
+        'matrix': matrix,
+        'ids': ids,
+        'names': names,
+        'wins': wins,
+        'losses': losses,
+        'is_unranked': is_unranked,
     }
 
 
-def generate_html_matrix(
-    matrix_data: Dict,
-    weight_class: str,
-    season: int,
-    force_backup_ids: Optional[List[str]] = None,
-) -> str:
-    """
-    Generate HTML for editable ranking matrix.
-    
-    Args:
-        matrix_data: Dictionary with wrestlers and matrix data
-        weight_class: Weight class string
-        season: Season year
-        
-    Returns:
-        HTML string
-    """
-    import html as html_escape
-    wrestlers = matrix_data['wrestlers']
-    matrix = matrix_data['matrix']
-    total_wrestlers = len(wrestlers)
-    
-    # Build tooltip data object for JavaScript
-    tooltip_data_js = {}
-    
-    html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Ranking Matrix: {weight_class} - Season {season}</title>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        body {{
+# Static stylesheet for the matrix page (plain string, not an f-string)
+_MATRIX_CSS = """\
+        body {
             font-family: Arial, sans-serif;
             margin: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             background-color: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             margin-top: 0;
-        }}
-        .controls {{
+        }
+        .controls {
             margin-bottom: 20px;
             padding: 10px;
             background-color: #f9f9f9;
             border-radius: 4px;
-        }}
-        .matrix-wrapper {{
+        }
+        .matrix-wrapper {
             overflow-x: auto;
             overflow-y: auto;
             max-height: 80vh;
-        }}
-        table {{
+        }
+        table {
             border-collapse: collapse;
             font-size: 12px;
-        }}
-        th, td {{
+        }
+        th, td {
             border: 1px solid #ddd;
             padding: 4px;
             text-align: center;
-        }}
-        th {{
+        }
+        th {
             background-color: #f2f2f2;
             position: sticky;
             top: 0;
             z-index: 10;
-        }}
-        .header-rank-row th {{
+        }
+        .header-rank-row th {
             top: 0;
             z-index: 12;
-        }}
-        .header-name-row th {{
+        }
+        .header-name-row th {
             top: 28px;
             z-index: 11;
-        }}
+        }
         /* Ensure top-left corner headers stay above body cells */
         .header-rank-row .rank-col,
         .header-rank-row .wrestler-col,
         .header-name-row .rank-col,
-        .header-name-row .wrestler-col {{
+        .header-name-row .wrestler-col {
             z-index: 20;
-        }}
-        th.rotate {{
+        }
+        th.rotate {
             height: 80px;
             white-space: nowrap;
             padding: 2px !important;
             font-size: 10px;
             vertical-align: bottom;
-        }}
-        th.rotate > div {{
+        }
+        th.rotate > div {
             transform: rotate(270deg);
             width: 15px;
             height: 15px;
-        }}
-        th.rotate > div > span {{
+        }
+        th.rotate > div > span {
             padding: 2px;
             display: inline-block;
-        }}
-        .rank-col {{
+        }
+        .rank-col {
             position: sticky;
             left: 0;
             background-color: #f2f2f2;
             z-index: 15;
             width: 50px;
-        }}
-        .wrestler-col {{
+        }
+        .wrestler-col {
             position: sticky;
             left: 50px;
             background-color: #f2f2f2;
@@ -586,66 +618,66 @@ def generate_html_matrix(
             min-width: 240px;
             text-align: left;
             padding: 8px;
-        }}
-        .wrestler-name {{
+        }
+        .wrestler-name {
             font-weight: bold;
             color: #000000;
-        }}
-        .wrestler-main-line {{
+        }
+        .wrestler-main-line {
             display: block;
-        }}
-        .wrestler-controls-line {{
+        }
+        .wrestler-controls-line {
             display: flex;
             align-items: center;
             gap: 6px;
             margin-top: 2px;
-        }}
+        }
         /* Recent matches (within last 7 days when matrix generated) */
-        .matrix-cell.recent {{
+        .matrix-cell.recent {
             border-width: 3px;
             border-style: solid;
-        }}
+        }
         .matrix-cell.direct_win.recent,
-        .matrix-cell.common_win.recent {{
+        .matrix-cell.common_win.recent {
             border-color: #008000;
-        }}
+        }
         .matrix-cell.direct_loss.recent,
-        .matrix-cell.common_loss.recent {{
+        .matrix-cell.common_loss.recent {
             border-color: #cc0000;
-        }}
+        }
         /* Anchor win/loss highlighting */
-        .matrix-cell.anchor-win {{
+        .matrix-cell.anchor-win {
             font-weight: bold;
             color: #005500;
-        }}
-        .matrix-cell.anchor-loss {{
+        }
+        .matrix-cell.anchor-loss {
             font-weight: bold;
             color: #990000;
-        }}
+        }
         /* Nudge first column header a bit right so it doesn't sit under 'Wrestler' */
-        .header-name-row th.rotate:first-of-type > div {{
+        .header-name-row th.rotate:first-of-type > div {
             margin-left: 20px;
-        }}
-        .wrestler-team {{
+        }
+        .wrestler-team {
             font-size: 10px;
             color: #666;
-        }}
-        .wrestler-note {{
+        }
+        .wrestler-note {
             font-size: 11px;
             color: #0066ff;
             font-weight: bold;
             margin-left: 4px;
-        }}
-        .rank-arrows {{
+        }
+        .rank-arrows {
             display: inline-flex;
             align-items: center;
             gap: 4px;
             margin-left: 10px;
-        }}
-        .wrestler-controls-line .rank-arrows {{
+        }
+        .wrestler-controls-line .rank-arrows {
             margin-left: 0;
-        }}
-        .rank-arrow {{
+        }
+        .rank-arrow {
             cursor: pointer;
             padding: 2px 6px;
             margin: 0 2px;
@@ -653,133 +685,133 @@ def generate_html_matrix(
             border-radius: 3px;
             background: #f8f8f8;
             font-size: 14px;
-        }}
-        .rank-input {{
+        }
+        .rank-input {
             width: 38px;
             padding: 2px;
             font-size: 11px;
             border: 1px solid #ccc;
             border-radius: 3px;
-        }}
-        .rank-go {{
+        }
+        .rank-go {
             padding: 2px 6px;
             font-size: 11px;
             border: 1px solid #ddd;
             border-radius: 3px;
             background: #f8f8f8;
             cursor: pointer;
-        }}
-        .rank-go:hover {{
+        }
+        .rank-go:hover {
             background: #e8e8e8;
-        }}
-        .rank-setter {{
+        }
+        .rank-setter {
             display: inline-flex;
             align-items: center;
             margin-left: 6px;
-        }}
-        .rank-set-input {{
+        }
+        .rank-set-input {
             width: 32px;
             font-size: 10px;
             padding: 1px 2px;
             margin-right: 2px;
-        }}
-        .rank-set-button {{
+        }
+        .rank-set-button {
             font-size: 10px;
             padding: 1px 4px;
             cursor: pointer;
-        }}
-        .rank-arrow:hover {{
+        }
+        .rank-arrow:hover {
             background: #e8e8e8;
-        }}
-        .matrix-cell {{
+        }
+        .matrix-cell {
             width: 30px;
             height: 30px;
             min-width: 30px;
             min-height: 30px;
             font-size: 9px;
             padding: 2px;
-        }}
-        .same-wrestler {{
+        }
+        .same-wrestler {
             background-color: #e0e0e0;
-        }}
+        }
         /* Split-even head-to-head (e.g., 1-1, 2-2) */
-        .split_even {{
+        .split_even {
             background-color: #fffacd; /* light yellow */
-        }}
-        .direct_win {{
+        }
+        .direct_win {
             background-color: #b3ffb3;
-        }}
-        .direct_loss {{
+        }
+        .direct_loss {
             background-color: #ffb3b3;
-        }}
+        }
         /* Severity shading for direct wins/losses */
-        .matrix-cell.direct_win.severity-strong {{
+        .matrix-cell.direct_win.severity-strong {
             background-color: #33cc33;
-        }}
-        .matrix-cell.direct_loss.severity-strong {{
+        }
+        .matrix-cell.direct_loss.severity-strong {
             background-color: #ff3333;
-        }}
-        .matrix-cell.direct_win.severity-medium {{
+        }
+        .matrix-cell.direct_win.severity-medium {
             background-color: #66e066;
-        }}
-        .matrix-cell.direct_loss.severity-medium {{
+        }
+        .matrix-cell.direct_loss.severity-medium {
             background-color: #ff6666;
-        }}
-        .matrix-cell.direct_win.severity-light {{
+        }
+        .matrix-cell.direct_win.severity-light {
             background-color: #b3ffb3;
-        }}
-        .matrix-cell.direct_loss.severity-light {{
+        }
+        .matrix-cell.direct_loss.severity-light {
             background-color: #ffb3b3;
-        }}
+        }
         /* Very light shading for common opponent cells */
-        .common_win {{
+        .common_win {
             background-color: #e6ffe6;
-        }}
-        .common_loss {{
+        }
+        .common_loss {
             background-color: #ffe6e6;
-        }}
-        .matrix-cell.common_win.severity-co {{
+        }
+        .matrix-cell.common_win.severity-co {
             background-color: #f2fff2;
-        }}
-        .matrix-cell.common_loss.severity-co {{
+        }
+        .matrix-cell.common_loss.severity-co {
             background-color: #fff2f2;
-        }}
+        }
         /* Medical forfeit (MFF) uses same light palette as common opponents */
-        .matrix-cell.direct_win.severity-co {{
+        .matrix-cell.direct_win.severity-co {
             background-color: #f2fff2;
-        }}
-        .matrix-cell.direct_loss.severity-co {{
+        }
+        .matrix-cell.direct_loss.severity-co {
             background-color: #fff2f2;
-        }}
+        }
         /* No contest (NC) neutral grey for both winner and loser */
         .matrix-cell.direct_win.severity-nc,
-        .matrix-cell.direct_loss.severity-nc {{
+        .matrix-cell.direct_loss.severity-nc {
             background-color: #e6e6e6;
-        }}
-        .col-rank-header {{
+        }
+        .col-rank-header {
             font-weight: bold;
-        }}
+        }
         /* Unranked wrestlers */
-        .unranked-row .wrestler-name {{
+        .unranked-row .wrestler-name {
             background-color: #fff6a3;
             padding: 2px 4px;
             border-radius: 3px;
-        }}
-        .unranked-row .rank-col {{
+        }
+        .unranked-row .rank-col {
             font-weight: bold;
-        }}
+        }
         /* Wrestlers with no matches (0-0 record) */
-        .no-matches-row .wrestler-name {{
+        .no-matches-row .wrestler-name {
             background-color: lightskyblue;
             padding: 2px 4px;
             border-radius: 3px;
-        }}
+        }
         /* Non-starters: clearly muted compared to starters */
-        .non-starter-row .wrestler-name {{
+        .non-starter-row .wrestler-name {
             color: #888888;
             font-weight: normal;
-        }}
-        #matrix-tooltip {{
+        }
+        #matrix-tooltip {
             display: none;
             position: fixed;
             background-color: #333;
@@ -793,27 +825,27 @@ def generate_html_matrix(
             line-height: 1.4;
             box-shadow: 0 2px 8px rgba(0,0,0,0.3);
             pointer-events: none;
-        }}
-        .matrix-cell[data-tooltip-id] {{
+        }
+        .matrix-cell[data-tooltip-id] {
             cursor: help;
-        }}
-        .tooltip-header {{
+        }
+        .tooltip-header {
             font-weight: bold;
             margin-bottom: 8px;
             border-bottom: 1px solid #555;
             padding-bottom: 4px;
-        }}
-        .tooltip-detail {{
+        }
+        .tooltip-detail {
             margin: 6px 0;
             padding-left: 10px;
-        }}
-        .tooltip-match {{
+        }
+        .tooltip-match {
             margin: 4px 0;
             padding-left: 20px;
             font-size: 10px;
             color: #ccc;
-        }}
-        #save-button {{
+        }
+        #save-button {
             position: fixed;
             bottom: 20px;
             right: 20px;
@@ -826,276 +858,94 @@ def generate_html_matrix(
             font-size: 16px;
             font-weight: bold;
             box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-        }}
-        #save-button:hover {{
+        }
+        #save-button:hover {
             background-color: #45a049;
-        }}
-        #save-button:disabled {{
+        }
+        #save-button:disabled {
             background-color: #ccc;
             cursor: not-allowed;
-        }}
-        .save-status {{
+        }
+        .save-status {
             margin-left: 10px;
             font-size: 14px;
-        }}
-        .save-success {{
+        }
+        .save-success {
             color: #4CAF50;
-        }}
-        .save-error {{
+        }
+        .save-error {
             color: #f44336;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Weight Class {weight_class} - Season {season}</h1>
-        <div class="controls">
-            <button id="save-button" onclick="saveRankings()">Save Rankings</button>
-            <span id="save-status"></span>
-        </div>
-        <div class="matrix-wrapper">
-            <table id="ranking-table">
-                <thead>
-                    <tr class="header-rank-row">
-                        <th class="rank-col"></th>
-                        <th class="wrestler-col"></th>
-"""
-
-    # Top header row: column ranks only
-    for idx, wrestler in enumerate(wrestlers):
-        col_rank = "UNR" if wrestler.get('is_unranked') else str(idx + 1)
-        html_content += f"""                        <th class="col-rank-header">{col_rank}</th>
-"""
-
-    html_content += """                    </tr>
-                    <tr class="header-name-row">
-                        <th class="rank-col">Rank</th>
-                        <th class="wrestler-col">Wrestler</th>
-"""
-    
-    # Second header row: rotated wrestler names (first initial + last name)
-    for wrestler in wrestlers:
-        short_name = abbreviate_name(wrestler['name'])
-        html_content += f"""                        <th class="rotate">
-                            <div><span>{short_name}</span></div>
-                        </th>
-"""
-    
-    html_content += """                    </tr>
-                </thead>
-                <tbody>
-"""
-    
-    # Add data rows
-    for i, wrestler in enumerate(wrestlers):
-        wins = wrestler.get('wins', 0) or 0
-        losses = wrestler.get('losses', 0) or 0
-        has_no_matches = (wins == 0 and losses == 0)
-        placement_note = wrestler.get('placement_note')
-
-        row_classes = []
-        if wrestler.get('is_unranked'):
-            row_classes.append("unranked-row")
-        if has_no_matches:
-            row_classes.append("no-matches-row")
-        if not wrestler.get('is_starter', True):
-            row_classes.append("non-starter-row")
-        row_class_attr = f' class="{" ".join(row_classes)}"' if row_classes else ""
-
-        rank_label = "UNR" if wrestler.get('is_unranked') else str(i + 1)
-        note_html = (
-            f'<span class="wrestler-note">({placement_note})</span>'
-            if placement_note
-            else ""
-        )
-
-        html_content += f"""                    <tr data-wrestler-id="{wrestler['id']}"{row_class_attr}>
-                        <td class="rank-col">{rank_label}</td>
-                        <td class="wrestler-col">
-                            <div class="wrestler-main-line">
-                            <span class="wrestler-name">{wrestler['name']}</span>
-                            <span class="wrestler-team">({wrestler['team']})</span>
-                            <span class="wrestler-record"> - {wins}-{losses}</span>{note_html}
-                            </div>
-                            <div class="wrestler-controls-line">
-                            <div class="rank-arrows">
-                                    <span class="rank-arrow" onclick="moveUp(this)" title="Move up">↑</span>
-                                    <span class="rank-arrow" onclick="moveDown(this)" title="Move down">↓</span>
-                                </div>"""
-        if has_no_matches:
-            html_content += f"""
-                                <div class="rank-setter">
-                                    <input type="number" min="1" max="{total_wrestlers}" class="rank-set-input" value="{total_wrestlers}" />
-                                    <button class="rank-set-button" onclick="setRank(this)" title="Set rank">Go</button>
-                                </div>"""
-        else:
-            html_content += f"""
-                                <div class="rank-setter">
-                                    <input type="number" min="1" max="{total_wrestlers}" class="rank-set-input" placeholder="#" />
-                                    <button class="rank-set-button" onclick="setRank(this)" title="Set rank">Go</button>
-                                </div>"""
-        html_content += """
-                            </div>
-                        </td>
-"""
-        # Add matrix cells
-        for j, opponent in enumerate(wrestlers):
-            if i == j:
-                html_content += f"""                        <td class="matrix-cell same-wrestler">-</td>
+        }
 """
-            else:
-                cell_key = f"{wrestler['id']}_{opponent['id']}"
-                cell_data = matrix.get(cell_key, {'type': 'none', 'value': '', 'tooltip': ''})
-                
-                # Build lightweight tooltip ID instead of inline JSON for performance
-                tooltip_data_attr = ''
-                tooltip_id = None
-                tooltip_info = None
-
-                # Common-opponent tooltip
-                if cell_data.get('co_details'):
-                    tooltip_id = f"{wrestler['id']}_{opponent['id']}"
-                    tooltip_data_attr = f' data-tooltip-id="{tooltip_id}"'
-                    winner_id = cell_data.get('co_winner')
-                    tooltip_info = {
-                        'header': f"{wrestler['name']} has common opponent win(s) over {opponent['name']}" if winner_id == wrestler['id'] else f"{opponent['name']} has common opponent win(s) over {wrestler['name']}",
-                        'details': []
-                    }
-                    for detail in cell_data['co_details'][:5]:
-                        if detail['winner_id'] == wrestler['id']:
-                            tooltip_info['details'].append({
-                                'opponent': detail['opponent_name'],
-                                'wrestler_result': f"{wrestler['name']} beat {detail['opponent_name']}",
-                                'wrestler_match': f"({detail['winner_match']['date']}, {detail['winner_match']['result']})",
-                                'opponent_result': f"{opponent['name']} lost to {detail['opponent_name']}",
-                                'opponent_match': f"({detail['loser_match']['date']}, {detail['loser_match']['result']})"
-                            })
-                        else:
-                            tooltip_info['details'].append({
-                                'opponent': detail['opponent_name'],
-                                'opponent_result': f"{opponent['name']} beat {detail['opponent_name']}",
-                                'opponent_match': f"({detail['winner_match']['date']}, {detail['winner_match']['result']})",
-                                'wrestler_result': f"{wrestler['name']} lost to {detail['opponent_name']}",
-                                'wrestler_match': f"({detail['loser_match']['date']}, {detail['loser_match']['result']})"
-                            })
-                    if len(cell_data['co_details']) > 5:
-                        tooltip_info['more_count'] = len(cell_data['co_details']) - 5
-
-                # Direct head-to-head tooltip (including split-even series)
-                elif cell_data.get('type') in ('direct_win', 'direct_loss', 'split_even') and cell_data.get('matches'):
-                    tooltip_id = f"{wrestler['id']}_{opponent['id']}"
-                    tooltip_data_attr = f' data-tooltip-id="{tooltip_id}"'
-                    tooltip_info = {
-                        'header': f"{wrestler['name']} vs {opponent['name']}",
-                        'details': []
-                    }
-                    for m in cell_data['matches'][:10]:
-                        winner_id = m.get('winner_id')
-                        date_str = m.get('date', '')
-                        raw_result = m.get('result', '')
-
-                        # Determine winner/loser and their teams from current cell context
-                        if winner_id == wrestler['id']:
-                            winner_name = wrestler['name']
-                            winner_team = wrestler.get('team', '')
-                            loser_name = opponent['name']
-                            loser_team = opponent.get('team', '')
-                        elif winner_id == opponent['id']:
-                            winner_name = opponent['name']
-                            winner_team = opponent.get('team', '')
-                            loser_name = wrestler['name']
-                            loser_team = wrestler.get('team', '')
-                        else:
-                            # If winner_id doesn't match either wrestler (shouldn't happen), skip this match
-                            continue
 
-                        summary_line = (
-                            f"{winner_name} ({winner_team}) defeated "
-                            f"{loser_name} ({loser_team}) ({raw_result})"
-                        ).strip()
 
-                        if date_str:
-                            line = f"{date_str}<br>{summary_line}"
-                        else:
-                            line = summary_line
-                    
-                        tooltip_info['details'].append({'line': line})
-                    
-                if tooltip_id and tooltip_info:
-                    tooltip_data_js[tooltip_id] = tooltip_info
-                
-                # Use simple title only for cells without rich tooltips
-                simple_tooltip = cell_data.get('tooltip', '').replace('\\n', ' ')
-                if cell_data['type'] in ('common_win', 'common_loss', 'direct_win', 'direct_loss', 'split_even'):
-                    # Let the rich tooltip handle hover; suppress native title
-                    simple_tooltip = ''
-                severity_class = ''
-                if cell_data.get('severity'):
-                    severity_class = f" severity-{cell_data['severity']}"
-                recent_class = ' recent' if cell_data.get('recent') else ''
-                html_content += f"""                        <td class="matrix-cell {cell_data['type']}{severity_class}{recent_class}" title="{simple_tooltip}"{tooltip_data_attr}>
-                            {cell_data['value']}
-                        </td>
-"""
-        
-        html_content += """                    </tr>
-"""
-    
-    html_content += """                </tbody>
-            </table>
-        </div>
-    </div>
-    
-    <!-- Single tooltip element for performance -->
-    <div id="matrix-tooltip"></div>
-    
-    <script>
-        console.log('Script starting to execute...'); // Debug
-        const weightClass = """ + json.dumps(weight_class) + """;
-        const season = """ + str(season) + """;
-        const wrestlers = """ + json.dumps(wrestlers) + """;
-        const forceBackupIds = new Set(""" + json.dumps(force_backup_ids or []) + """);
-        console.log('Variables initialized, wrestlers count:', wrestlers.length); // Debug
-        
-        // Store tooltip data in global object for tooltip system
-        window.tooltipData = """ + json.dumps(tooltip_data_js) + """;
+# Static page script: tooltip display, anchor highlighting, row reordering
+# and the JSON download. It relies on the weightClass, season, wrestlers,
+# forceBackupIds, window.tooltipStrings and window.tooltipData globals
+# written just before it.
+_MATRIX_SCRIPT = """\
         
         const tooltip = document.getElementById("matrix-tooltip");
+        // Wrestler records by ID (reordering the wrestlers array keeps the
+        // same objects, so this never needs rebuilding)
+        const wrestlerById = new Map(wrestlers.map(w => [w.id, w]));
         
-        // Attach handlers to all cells with tooltip IDs
+        // Tooltip HTML is rendered server-side as string-table indexes;
+        // join them the first time a tooltip is shown and keep the result
+        function getTooltipHtml(id) {
+            let tooltipHtml = window.tooltipData[id];
+            if (Array.isArray(tooltipHtml)) {
+                const strings = window.tooltipStrings;
+                tooltipHtml = tooltipHtml.map(i => strings[i]).join("");
+                window.tooltipData[id] = tooltipHtml;
+            }
+            return tooltipHtml;
+        }
+
+        // One set of delegated handlers on the table body serves every cell
+        // with a tooltip ID (rows keep working after they are reordered).
         function attachTooltipHandlers() {
-            document.querySelectorAll(".matrix-cell[data-tooltip-id]").forEach(cell => {
-                cell.addEventListener("mouseenter", e => {
-                    const id = cell.dataset.tooltipId;
-                    const data = window.tooltipData[id];
+            const tbody = document.querySelector("#ranking-table tbody");
+            if (!tbody) return;
+            // Tooltip ID currently rendered into the tooltip element
+            let lastTooltipId = null;
+
+            tbody.addEventListener("mouseover", e => {
+                const cell = e.target.closest(".matrix-cell[data-tooltip-id]");
+                const id = cell ? cell.dataset.tooltipId : null;
+                const tooltipHtml = id !== null ? getTooltipHtml(id) : null;
         
-                    if (!data) {
-                        tooltip.style.display = "none";
-                        return;
-                    }
+                if (!tooltipHtml) {
+                    tooltip.style.display = "none";
+                    return;
+                }
         
-                    tooltip.innerHTML = `
-                        <div class="tooltip-header">${data.header}</div>
-                        ${data.details.map(d => `
-                            <div class="tooltip-detail">${
-                                d.line
-                                    ? d.line
-                                    : `${d.wrestler_result || ""}<br>${d.opponent_result || ""}`
-                            }</div>
-                        `).join("")}
-                    `;
+                // Only rebuild the markup when the hovered payload changes
+                if (id !== lastTooltipId) {
+                    lastTooltipId = id;
+                    tooltip.innerHTML = tooltipHtml;
+                }
         
-                    tooltip.style.display = "block";
-                });
+                tooltip.style.display = "block";
+            });
         
-                cell.addEventListener("mousemove", e => {
-                    tooltip.style.left = (e.pageX + 12) + "px";
-                    tooltip.style.top = (e.pageY + 12) + "px";
+            // Coalesce mouse moves so the tooltip is repositioned at most
+            // once per animation frame
+            let pendingMove = null;
+            let moveFrame = 0;
+            tbody.addEventListener("mousemove", e => {
+                if (tooltip.style.display !== "block") return;
+                pendingMove = e;
+                if (moveFrame) return;
+                moveFrame = requestAnimationFrame(() => {
+                    moveFrame = 0;
+                    tooltip.style.left = (pendingMove.pageX + 12) + "px";
+                    tooltip.style.top = (pendingMove.pageY + 12) + "px";
                 });
+            });
         
-                cell.addEventListener("mouseleave", e => {
-                    tooltip.style.display = "none";
-                });
+            tbody.addEventListener("mouseleave", e => {
+                tooltip.style.display = "none";
             });
         }
         
@@ -1109,14 +959,9 @@ def generate_html_matrix(
                 td.classList.remove('anchor-win', 'anchor-loss');
             });
 
-            const tbody = table.querySelector('tbody');
-            if (!tbody) return;
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-
-            rows.forEach(row => {
-                const cells = Array.from(row.querySelectorAll('td'));
+            getRows().forEach(row => {
                 // Skip first two columns (rank + wrestler)
-                const dataCells = cells.slice(2);
+                const dataCells = Array.prototype.slice.call(row.cells, 2);
                 if (!dataCells.length) return;
 
                 const lossIdxs = [];
@@ -1161,20 +1006,37 @@ def generate_html_matrix(
             });
         }
 
+        // Initial anchors are rendered server-side; recomputeAnchors only
+        // runs after the user reorders rows.
         function initializeMatrixInteractions() {
             attachTooltipHandlers();
-            recomputeAnchors();
         }
 
-        // Initialize tooltip handlers and anchors
-        window.addEventListener("DOMContentLoaded", initializeMatrixInteractions);
+        // Initialize tooltip handlers once the browser is idle so they never
+        // delay the first paint of a large table
+        window.addEventListener("DOMContentLoaded", () => {
+            if (window.requestIdleCallback) {
+                requestIdleCallback(initializeMatrixInteractions);
+            } else {
+                setTimeout(initializeMatrixInteractions, 0);
+            }
+        });
         
+        // Body rows in display order. Reorders keep this array in step with
+        // the DOM, so it is only read from the table once.
+        let rowsCache = null;
+        function getRows() {
+            if (!rowsCache) {
+                const tbody = document.getElementById('ranking-table').tBodies[0];
+                rowsCache = tbody ? Array.from(tbody.rows) : [];
+            }
+            return rowsCache;
+        }
+
         function getRowIndexFromElement(elem) {
             const row = elem.closest('tr');
             if (!row) return -1;
-            const tbody = row.parentNode;
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-            return rows.indexOf(row);
+            return getRows().indexOf(row);
         }
         
         function moveUp(elem) {
@@ -1189,10 +1051,7 @@ def generate_html_matrix(
         function moveDown(elem) {
             const index = getRowIndexFromElement(elem);
             console.log('moveDown clicked, row index:', index);
-            const table = document.getElementById('ranking-table');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-            if (index < 0 || index >= rows.length - 1) return;
+            if (index < 0 || index >= getRows().length - 1) return;
             swapRows(index, index + 1);
             updateRanks();
             recomputeAnchors();
@@ -1203,123 +1062,93 @@ def generate_html_matrix(
         window.moveDown = moveDown;
         
         function swapRows(index1, index2) {
+            // Only ever called with neighbouring rows, where a swap is a move
+            moveRowToPosition(index1, index2);
+        }
+
+        // Move the row at fromIdx to position toIdx in one pass, keeping the
+        // header columns, every row's matrix cells and the wrestlers array in
+        // the same order.
+        function moveRowToPosition(fromIdx, toIdx) {
+            if (fromIdx === toIdx) return;
             const table = document.getElementById('ranking-table');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-            
-            // Swap the rows in tbody
-            const row1 = rows[index1];
-            const row2 = rows[index2];
-            if (!row1 || !row2) return;
-            
-            if (index1 < index2) {
-                // Moving down: place row1 after row2
-            tbody.insertBefore(row1, row2.nextSibling);
-            } else {
-                // Moving up: place row1 before row2
-                tbody.insertBefore(row1, row2);
+            const rows = getRows();
+            if (!rows[fromIdx] || !rows[toIdx]) return;
+            const maxIdx = Math.max(fromIdx, toIdx);
+
+            // Moving down places the item after the one at toIdx, moving up
+            // places it before. offset skips leading non-matrix cells.
+            function moveItem(parent, items, offset) {
+                const item = items[fromIdx + offset];
+                const target = items[toIdx + offset];
+                parent.insertBefore(item, fromIdx < toIdx ? target.nextSibling : target);
             }
+
+            moveItem(rows[0].parentNode, rows, 0);
+            rows.splice(toIdx, 0, rows.splice(fromIdx, 1)[0]);
             
-            // Swap columns in header (both rank row and name row; skip first 2 columns)
-            const thead = table.querySelector('thead');
+            // Move columns in header (both rank row and name row; skip first 2 columns)
+            const thead = table.tHead;
             const rankRow = thead.querySelector('.header-rank-row');
             const nameRow = thead.querySelector('.header-name-row');
             if (rankRow && nameRow) {
-                const rankHeaders = Array.from(rankRow.querySelectorAll('th.col-rank-header'));
-                const nameHeaders = Array.from(nameRow.querySelectorAll('th.rotate'));
-                if (rankHeaders.length > Math.max(index1, index2) && nameHeaders.length > Math.max(index1, index2)) {
-                    const r1 = rankHeaders[index1];
-                    const r2 = rankHeaders[index2];
-                    const n1 = nameHeaders[index1];
-                    const n2 = nameHeaders[index2];
-                    if (index1 < index2) {
-                        // Moving down: place r1/n1 after r2/n2
-                        rankRow.insertBefore(r1, r2.nextSibling);
-                        nameRow.insertBefore(n1, n2.nextSibling);
-                    } else {
-                        // Moving up: place r1/n1 before r2/n2
-                        rankRow.insertBefore(r1, r2);
-                        nameRow.insertBefore(n1, n2);
-                    }
+                if (rankRow.cells.length > maxIdx + 2 && nameRow.cells.length > maxIdx + 2) {
+                    moveItem(rankRow, rankRow.cells, 2);
+                    moveItem(nameRow, nameRow.cells, 2);
                 }
             }
             
-            // Swap cells in all data rows (skip first 2 cells: rank and wrestler name)
-            const allRows = Array.from(tbody.querySelectorAll('tr'));
-            allRows.forEach(row => {
-                const cells = Array.from(row.querySelectorAll('td'));
-                // Skip first 2 cells (rank and wrestler columns)
-                const matrixCells = cells.slice(2);
-                if (matrixCells.length > Math.max(index1, index2)) {
-                    const c1 = matrixCells[index1];
-                    const c2 = matrixCells[index2];
-                    const parent = c1.parentNode;
-                    if (index1 < index2) {
-                        // Moving down: place c1 after c2
-                    parent.insertBefore(c1, c2.nextSibling);
-                    } else {
-                        // Moving up: place c1 before c2
-                        parent.insertBefore(c1, c2);
-                    }
+            // Move the column's cell in every data row (skip first 2 cells: rank and wrestler name)
+            rows.forEach(row => {
+                if (row.cells.length > maxIdx + 2) {
+                    moveItem(row, row.cells, 2);
                 }
             });
             
             // Update the wrestlers array order
-            [wrestlers[index1], wrestlers[index2]] = [wrestlers[index2], wrestlers[index1]];
+            const [moved] = wrestlers.splice(fromIdx, 1);
+            wrestlers.splice(toIdx, 0, moved);
             
             // Fix diagonal same-wrestler cells
-            updateDiagonalCells();
+            updateDiagonalCells(Math.min(fromIdx, toIdx), maxIdx);
         }
 
-        function updateDiagonalCells() {
-            const table = document.getElementById('ranking-table');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-            
-            rows.forEach(row => {
-                const rowWrestlerId = row.getAttribute('data-wrestler-id');
-                const cells = Array.from(row.querySelectorAll('td')).slice(2);
+        // Re-mark same-wrestler cells after the rows/columns between lo and
+        // hi (inclusive) moved. Rows and columns move together, so a
+        // diagonal cell stays on the diagonal; only the diagonal cells of
+        // the moved range need checking.
+        function updateDiagonalCells(lo, hi) {
+            const rows = getRows();
+            for (let index = lo; index <= hi; index++) {
+                const row = rows[index];
+                const cell = row ? row.cells[index + 2] : null;
+                const colWrestler = wrestlers[index];
+                if (!cell || !colWrestler) continue;
                 
-                cells.forEach((cell, colIndex) => {
-                    const colWrestler = wrestlers[colIndex];
-                    if (!colWrestler) return;
-                    const colWrestlerId = colWrestler.id;
-                    
-                    if (rowWrestlerId === colWrestlerId) {
-                        cell.classList.add('same-wrestler');
-                        cell.textContent = '-';
-                        cell.title = '';
-                    } else if (cell.classList.contains('same-wrestler')) {
-                        cell.classList.remove('same-wrestler');
-                        if (cell.textContent.trim() === '-') {
-                            cell.textContent = '';
-                        }
+                if (row.getAttribute('data-wrestler-id') === colWrestler.id) {
+                    cell.classList.add('same-wrestler');
+                    cell.textContent = '-';
+                    cell.title = '';
+                } else if (cell.classList.contains('same-wrestler')) {
+                    cell.classList.remove('same-wrestler');
+                    if (cell.textContent.trim() === '-') {
+                        cell.textContent = '';
                     }
-                });
-            });
+                }
+            }
         }
         
         function moveRowToRank(row, targetRank) {
-            const table = document.getElementById('ranking-table');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
+            const rows = getRows();
             
-            let currentIndex = rows.indexOf(row);
+            const currentIndex = rows.indexOf(row);
             const targetIndex = targetRank - 1;
             
             if (currentIndex === -1 || targetIndex < 0 || targetIndex >= rows.length) {
                 return;
             }
             
-            // Move step-by-step using swapRows so headers and cells stay in sync
-            while (currentIndex < targetIndex) {
-                swapRows(currentIndex, currentIndex + 1);
-                currentIndex++;
-            }
-            while (currentIndex > targetIndex) {
-                swapRows(currentIndex, currentIndex - 1);
-                currentIndex--;
-            }
+            moveRowToPosition(currentIndex, targetIndex);
             
             updateRanks();
             recomputeAnchors();
@@ -1343,12 +1172,10 @@ def generate_html_matrix(
         
         function updateRanks() {
             const table = document.getElementById('ranking-table');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
-            rows.forEach((row, index) => {
+            getRows().forEach((row, index) => {
                 // Once ranks are updated manually, clear unranked highlighting
                 row.classList.remove('unranked-row');
-                const rankCell = row.querySelector('.rank-col');
+                const rankCell = row.cells[0];
                 if (rankCell) {
                     rankCell.textContent = index + 1;
                 }
@@ -1368,15 +1195,12 @@ def generate_html_matrix(
         }
         
         function getCurrentRankings() {
-            const table = document.getElementById('ranking-table');
-            const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
             const rankings = [];
             
             // First, build the raw rankings list in current row order.
-            rows.forEach((row, index) => {
+            getRows().forEach((row, index) => {
                 const wrestlerId = row.getAttribute('data-wrestler-id');
-                const wrestler = wrestlers.find(w => w.id === wrestlerId);
+                const wrestler = wrestlerById.get(wrestlerId);
                 if (wrestler) {
                     rankings.push({
                         rank: index + 1,
@@ -1460,15 +1284,429 @@ def generate_html_matrix(
     </script>
 </body>
 </html>"""
+
+
+# Matrix cell markup, split after the class list (for the anchor class) and
+# around the optional data-tooltip-id attribute.
+# Classes: type, severity class, recent class; title; close: cell text
+_CELL_CLASS_HTML = """\
+                        <td class="matrix-cell %s%s%s"""
+_CELL_TITLE_HTML = '" title="%s"'
+_CELL_CLOSE_HTML = """>
+                            %s
+                        </td>
+"""
+# Cell for pairs with no relationship
+_EMPTY_CELL_HTML = (
+    _CELL_CLASS_HTML % ('none', '', '')
+    + _CELL_TITLE_HTML % ''
+    + _CELL_CLOSE_HTML % ''
+)
+
+# Rich tooltip content: the tooltip's inner HTML as a tuple of pieces to
+# concatenate (markup and sentences kept apart so the string table can
+# share them). Tuples keep payloads hashable for deduplication.
+TooltipPayload = Tuple[str, ...]
+_TOOLTIP_HEADER_OPEN = '<div class="tooltip-header">'
+_TOOLTIP_DETAIL_OPEN = '<div class="tooltip-detail">'
+_TOOLTIP_DIV_CLOSE = '</div>'
+
+_SAME_WRESTLER_CELL_HTML = """\
+                        <td class="matrix-cell same-wrestler">-</td>
+"""
+
+
+def anchor_columns(matrix_row: List[Optional[CellData]]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Column indexes of a row's anchor win and anchor loss (None if absent),
+    matching recomputeAnchors() in the page script.
+
+    The anchor win is the first win to the right of the row's rightmost
+    (lowest-ranked) loss; the anchor loss is the leftmost loss, provided no
+    win sits to its left.
+    """
+    first_win = first_loss = last_loss = None
+    win_cols = []
+    for j, cell in enumerate(matrix_row):
+        if cell is None:
+            continue
+        cell_type = cell.type
+        if cell_type == 'direct_loss' or cell_type == 'common_loss':
+            if first_loss is None:
+                first_loss = j
+            last_loss = j
+        elif cell_type == 'direct_win' or cell_type == 'common_win':
+            if first_win is None:
+                first_win = j
+            win_cols.append(j)
+
+    if last_loss is None:
+        return None, None
+    anchor_win = next((j for j in win_cols if j > last_loss), None)
+    anchor_loss = first_loss if first_win is None or first_win > first_loss else None
+    return anchor_win, anchor_loss
+
+
+def _render_cell(
+    cell_data: CellData,
+    row_id: str,
+    row_name: str,
+    row_team: str,
+    opp_id: str,
+    opp_name: str,
+    opp_team: str,
+) -> Tuple[str, str, Optional[TooltipPayload], str]:
+    """
+    Render one matrix cell for the row/column wrestlers (names and teams
+    already HTML-escaped).
+
+    Returns:
+        (opening <td up to the end of the class list, title attribute,
+        tooltip payload or None, rest of the cell); the caller
+        may append an anchor class after the first fragment and inserts the
+        data-tooltip-id attribute before the last one.
+    """
+    tooltip_info = None
+
+    cell_type = cell_data.type
+    co_details = cell_data.co_details
+
+    # Common-opponent tooltip
+    if co_details:
+        winner_id = cell_data.co_winner
+        if winner_id == row_id:
+            header = f"{row_name} has common opponent win(s) over {opp_name}"
+        else:
+            header = f"{opp_name} has common opponent win(s) over {row_name}"
+        pieces = [_TOOLTIP_HEADER_OPEN, header, _TOOLTIP_DIV_CLOSE]
+        # Sentence stems shared by every detail line of this cell
+        row_beat = row_name + " beat "
+        row_lost = row_name + " lost to "
+        opp_beat = opp_name + " beat "
+        opp_lost = opp_name + " lost to "
+        for detail in co_details[:5]:
+            co_opp_name = html.escape(detail['opponent_name'])
+            # Row wrestler's result, then the column wrestler's
+            if detail['winner_id'] == row_id:
+                pieces += (
+                    _TOOLTIP_DETAIL_OPEN, row_beat + co_opp_name, "<br>",
+                    opp_lost + co_opp_name, _TOOLTIP_DIV_CLOSE,
+                )
+            else:
+                pieces += (
+                    _TOOLTIP_DETAIL_OPEN, row_lost + co_opp_name, "<br>",
+                    opp_beat + co_opp_name, _TOOLTIP_DIV_CLOSE,
+                )
+        tooltip_info = tuple(pieces)
+
+    # Direct head-to-head tooltip (including split-even series)
+    elif cell_type in ('direct_win', 'direct_loss', 'split_even') and cell_data.matches:
+        pieces = [_TOOLTIP_HEADER_OPEN, f"{row_name} vs {opp_name}", _TOOLTIP_DIV_CLOSE]
+        # "Winner (Team) defeated Loser (Team) (" for either direction
+        row_over_opp = f"{row_name} ({row_team}) defeated {opp_name} ({opp_team}) ("
+        opp_over_row = f"{opp_name} ({opp_team}) defeated {row_name} ({row_team}) ("
+        for m in cell_data.matches[:10]:
+            winner_id = m.get('winner_id')
+            date_str = html.escape(m.get('date', ''))
+            raw_result = html.escape(m.get('result', ''))
+
+            # Determine winner/loser from current cell context
+            if winner_id == row_id:
+                summary_prefix = row_over_opp
+            elif winner_id == opp_id:
+                summary_prefix = opp_over_row
+            else:
+                # If winner_id doesn't match either wrestler (shouldn't happen), skip this match
+                continue
+
+            summary_line = f"{summary_prefix}{raw_result})".strip()
+
+            if date_str:
+                line = f"{date_str}<br>{summary_line}"
+            else:
+                line = summary_line
+
+            pieces += (_TOOLTIP_DETAIL_OPEN, line, _TOOLTIP_DIV_CLOSE)
+        tooltip_info = tuple(pieces)
+
+    # Use simple title only for cells without rich tooltips
+    simple_tooltip = cell_data.tooltip.replace('\\n', ' ')
+    if cell_type in ('common_win', 'common_loss', 'direct_win', 'direct_loss', 'split_even'):
+        # Let the rich tooltip handle hover; suppress native title
+        simple_tooltip = ''
+    severity = cell_data.severity
+    severity_class = f" severity-{severity}" if severity else ''
+    recent_class = ' recent' if cell_data.recent else ''
+    return (
+        _CELL_CLASS_HTML % (cell_type, severity_class, recent_class),
+        _CELL_TITLE_HTML % simple_tooltip,
+        tooltip_info,
+        _CELL_CLOSE_HTML % cell_data.value,
+    )
+
+
+def stream_html_matrix(
+    out: TextIO,
+    matrix_data: Dict,
+    weight_class: str,
+    season: int,
+    force_backup_ids: Optional[List[str]] = None,
+) -> None:
+    """
+    Write HTML for editable ranking matrix to a text stream.
+    
+    Args:
+        out: Writable text stream (e.g. an open file)
+        matrix_data: Dictionary from build_matrix_data (wrestlers, the
+            N x N matrix and the parallel per-wrestler lists)
+        weight_class: Weight class string
+        season: Season year
+    """
+    write = out.write
+    wrestlers = matrix_data['wrestlers']
+    matrix = matrix_data['matrix']
+    total_wrestlers = len(wrestlers)
+
+    # Per-wrestler values reused by the header rows and every matrix cell.
+    # Names and teams are HTML-escaped once here; they end up in markup and
+    # in tooltip text that the page inserts via innerHTML.
+    esc = html.escape
+    ids = matrix_data['ids']
+    raw_names = matrix_data['names']
+    wins = matrix_data['wins']
+    losses = matrix_data['losses']
+    is_unranked = matrix_data['is_unranked']
+    names = [esc(name) for name in raw_names]
+    teams = [esc(w.get('team', '')) for w in wrestlers]
+    short_names = [esc(abbreviate_name(name)) for name in raw_names]
+    col_ranks = [
+        "UNR" if unranked else str(idx + 1)
+        for idx, unranked in enumerate(is_unranked)
+    ]
+    
+    # Encoded tooltip payloads for JavaScript; a cell's data-tooltip-id is
+    # its index in this list. Identical payloads share one entry, and their
+    # strings are stored once in tooltip_strings and referenced by index.
+    tooltip_payloads: List[List[int]] = []
+    tooltip_ids: Dict[TooltipPayload, int] = {}
+    tooltip_strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        idx = string_ids.get(text)
+        if idx is None:
+            idx = string_ids[text] = len(tooltip_strings)
+            tooltip_strings.append(text)
+        return idx
+    
+    write(f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>Ranking Matrix: {weight_class} - Season {season}</title>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+""")
+    write(_MATRIX_CSS)
+    write(f"""    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Weight Class {weight_class} - Season {season}</h1>
+        <div class="controls">
+            <button id="save-button" onclick="saveRankings()">Save Rankings</button>
+            <span id="save-status"></span>
+        </div>
+        <div class="matrix-wrapper">
+            <table id="ranking-table">
+                <thead>
+                    <tr class="header-rank-row">
+                        <th class="rank-col"></th>
+                        <th class="wrestler-col"></th>
+""")
+
+    # Top header row: column ranks only
+    for col_rank in col_ranks:
+        write(f"""                        <th class="col-rank-header">{col_rank}</th>
+""")
+
+    write("""                    </tr>
+                    <tr class="header-name-row">
+                        <th class="rank-col">Rank</th>
+                        <th class="wrestler-col">Wrestler</th>
+""")
+    
+    # Second header row: rotated wrestler names (first initial + last name)
+    for short_name in short_names:
+        write(f"""                        <th class="rotate">
+                            <div><span>{short_name}</span></div>
+                        </th>
+""")
+    
+    write("""                    </tr>
+                </thead>
+                <tbody>
+""")
+    
+    # Pre-render each row's rank and wrestler columns once; the row loop
+    # below only appends the matrix cells after them.
+    row_prefixes: List[str] = []
+    for i, wrestler in enumerate(wrestlers):
+        has_no_matches = (wins[i] == 0 and losses[i] == 0)
+        placement_note = wrestler.get('placement_note')
+
+        row_classes = []
+        if is_unranked[i]:
+            row_classes.append("unranked-row")
+        if has_no_matches:
+            row_classes.append("no-matches-row")
+        if not wrestler.get('is_starter', True):
+            row_classes.append("non-starter-row")
+        row_class_attr = f' class="{" ".join(row_classes)}"' if row_classes else ""
+
+        rank_label = col_ranks[i]
+        note_html = (
+            f'<span class="wrestler-note">({esc(placement_note)})</span>'
+            if placement_note
+            else ""
+        )
+        # Wrestlers without matches default the rank box to the bottom slot
+        rank_input_attr = f'value="{total_wrestlers}"' if has_no_matches else 'placeholder="#"'
+
+        row_prefixes.append(f"""                    <tr data-wrestler-id="{ids[i]}"{row_class_attr}>
+                        <td class="rank-col">{rank_label}</td>
+                        <td class="wrestler-col">
+                            <div class="wrestler-main-line">
+                            <span class="wrestler-name">{names[i]}</span>
+                            <span class="wrestler-team">({teams[i]})</span>
+                            <span class="wrestler-record"> - {wins[i]}-{losses[i]}</span>{note_html}
+                            </div>
+                            <div class="wrestler-controls-line">
+                            <div class="rank-arrows">
+                                    <span class="rank-arrow" onclick="moveUp(this)" title="Move up">↑</span>
+                                    <span class="rank-arrow" onclick="moveDown(this)" title="Move down">↓</span>
+                                </div>
+                                <div class="rank-setter">
+                                    <input type="number" min="1" max="{total_wrestlers}" class="rank-set-input" {rank_input_attr} />
+                                    <button class="rank-set-button" onclick="setRank(this)" title="Set rank">Go</button>
+                                </div>
+                            </div>
+                        </td>
+""")
+
+    # Add data rows
+    for i in range(total_wrestlers):
+        write(row_prefixes[i])
+        # Add matrix cells
+        row_id = ids[i]
+        row_name = names[i]
+        row_team = teams[i]
+        matrix_row = matrix[i]
+        anchor_win_col, anchor_loss_col = anchor_columns(matrix_row)
+        for j, opp_id in enumerate(ids):
+            if i == j:
+                write(_SAME_WRESTLER_CELL_HTML)
+                continue
+            cell_data = matrix_row[j]
+            if cell_data is None:
+                write(_EMPTY_CELL_HTML)
+                continue
+
+            cell_classes, cell_title, tooltip_info, cell_close = _render_cell(
+                cell_data, row_id, row_name, row_team, opp_id, names[j], teams[j]
+            )
+
+            write(cell_classes)
+            if j == anchor_win_col:
+                write(' anchor-win')
+            elif j == anchor_loss_col:
+                write(' anchor-loss')
+            write(cell_title)
+            if tooltip_info is not None:
+                # Lightweight tooltip ID instead of inline JSON for performance
+                tooltip_id = tooltip_ids.get(tooltip_info)
+                if tooltip_id is None:
+                    tooltip_id = tooltip_ids[tooltip_info] = len(tooltip_payloads)
+                    tooltip_payloads.append([intern(piece) for piece in tooltip_info])
+                write(f' data-tooltip-id="{tooltip_id}"')
+            write(cell_close)
+        
+        write("""                    </tr>
+""")
+    
+    write("""                </tbody>
+            </table>
+        </div>
+    </div>
+    
+    <!-- Single tooltip element for performance -->
+    <div id="matrix-tooltip"></div>
+    
+    <script>
+        console.log('Script starting to execute...'); // Debug
+        const weightClass = """ + _dumps(weight_class) + """;
+        const season = """ + str(season) + """;
+        const wrestlers = """ + _dumps(wrestlers) + """;
+        const forceBackupIds = new Set(""" + _dumps(force_backup_ids or []) + """);
+        console.log('Variables initialized, wrestlers count:', wrestlers.length); // Debug
+        
+        // Store tooltip data in global object for tooltip system
+        window.tooltipStrings = """ + _dumps(tooltip_strings) + """;
+        window.tooltipData = """ + _dumps(tooltip_payloads) + """;
+""")
+    write(_MATRIX_SCRIPT)
+
+
+def generate_html_matrix(
+    matrix_data: Dict,
+    weight_class: str,
+    season: int,
+    force_backup_ids: Optional[List[str]] = None,
+) -> str:
+    """
+    Generate HTML for editable ranking matrix.
     
-    return html_content
+    Args:
+        matrix_data: Dictionary with wrestlers and matrix data
+        weight_class: Weight class string
+        season: Season year
+        
+    Returns:
+        HTML string
+    """
+    buf = io.StringIO()
+    stream_html_matrix(buf, matrix_data, weight_class, season, force_backup_ids)
+    return buf.getvalue()
+
+
+def load_placement_notes(data_dir: str = "mt/rankings_data") -> Dict[str, str]:
+    """
+    Load placement notes (season-agnostic) from placement_notes.json.
+    Returns mapping wrestler_id -> upper-cased note.
+    """
+    placement_notes_path = Path(data_dir) / "placement_notes.json"
+    placement_notes_map: Dict[str, str] = {}
+    if placement_notes_path.exists():
+        try:
+            with open(placement_notes_path, "r", encoding="utf-8") as pf:
+                raw_notes = json.load(pf)
+            for entry in raw_notes.get("notes", []):
+                wid = entry.get("wrestler_id")
+                note = str(entry.get("note", "")).strip().upper()
+                if wid and note:
+                    placement_notes_map[wid] = note
+        except Exception as e:
+            print(f"Warning: Failed to load placement notes from {placement_notes_path}: {e}")
+    return placement_notes_map
 
 
 def generate_matrix_for_weight_class(
     weight_class: str,
     season: int,
     data_dir: str = "mt/rankings_data",
-    output_dir: str = "mt/rankings_html"
+    output_dir: str = "mt/rankings_html",
+    placement_notes_map: Optional[Dict[str, str]] = None,
+    gzip_output: bool = False,
 ) -> Path:
     """
     Generate HTML matrix for a single weight class.
@@ -1478,12 +1716,42 @@ def generate_matrix_for_weight_class(
         season: Season year
         data_dir: Directory containing relationship files
         output_dir: Directory to save HTML files
+        placement_notes_map: Placement notes from load_placement_notes;
+            loaded from data_dir when not given
+        gzip_output: Also write a gzip-compressed copy next to the HTML
+            file (matrix_{weight}.html.gz) for static hosting
         
     Returns:
         Path to generated HTML file
     """
+    if placement_notes_map is None:
+        placement_notes_map = load_placement_notes(data_dir)
+    season_out_dir = Path(output_dir) / str(season)
+    season_out_dir.mkdir(parents=True, exist_ok=True)
+    return _generate_matrix_impl(
+        weight_class,
+        season,
+        Path(data_dir) / str(season),
+        season_out_dir,
+        placement_notes_map,
+        gzip_output,
+    )
+
+
+def _generate_matrix_impl(
+    weight_class: str,
+    season: int,
+    season_data_dir: Path,
+    season_out_dir: Path,
+    placement_notes_map: Dict[str, str],
+    gzip_output: bool,
+) -> Path:
+    """
+    generate_matrix_for_weight_class with the season's data and output
+    directories already resolved (the output directory must exist).
+    """
     # Load relationships
-    rel_file = Path(data_dir) / str(season) / f"relationships_{weight_class}.json"
+    rel_file = season_data_dir / f"relationships_{weight_class}.json"
     
     if not rel_file.exists():
         raise FileNotFoundError(f"Relationship file not found: {rel_file}")
@@ -1494,7 +1762,7 @@ def generate_matrix_for_weight_class(
     # If a manual rankings file exists, load it, attach ordering, and
     # derive starter status per wrestler (best-ranked per team),
     # honoring any season-wide starter overrides.
-    rankings_file = Path(data_dir) / str(season) / f"rankings_{weight_class}.json"
+    rankings_file = season_data_dir / f"rankings_{weight_class}.json"
     # Default: no forced backups unless overrides/rankings exist.
     force_backup_ids = set()
     if rankings_file.exists():
@@ -1506,7 +1774,7 @@ def generate_matrix_for_weight_class(
             relationships_data['ranking_order'] = ranking_ids
 
             # Load global starter overrides for this season, if present.
-            overrides_path = Path(data_dir) / str(season) / "starter_overrides.json"
+            overrides_path = season_data_dir / "starter_overrides.json"
             if overrides_path.exists():
                 try:
                     with open(overrides_path, 'r', encoding='utf-8') as of:
@@ -1552,40 +1820,26 @@ def generate_matrix_for_weight_class(
         except Exception as e:
             print(f"Warning: Failed to load rankings file {rankings_file}: {e}")
 
-    # Load placement notes (season-agnostic, keyed by wrestler_id)
-    placement_notes_path = Path(data_dir) / "placement_notes.json"
-    placement_notes_map: Dict[str, str] = {}
-    if placement_notes_path.exists():
-        try:
-            with open(placement_notes_path, "r", encoding="utf-8") as pf:
-                raw_notes = json.load(pf)
-            for entry in raw_notes.get("notes", []):
-                wid = entry.get("wrestler_id")
-                note = str(entry.get("note", "")).strip().upper()
-                if wid and note:
-                    placement_notes_map[wid] = note
-        except Exception as e:
-            print(f"Warning: Failed to load placement notes from {placement_notes_path}: {e}")
-    
     # Build matrix data
     matrix_data = build_matrix_data(relationships_data, placement_notes=placement_notes_map)
     
-    # Generate HTML, passing starter overrides so the JS "Save Rankings"
-    # button can honor them when computing is_starter flags.
-    html = generate_html_matrix(
-        matrix_data,
-        weight_class,
-        season,
-        force_backup_ids=list(force_backup_ids),
-    )
-    
-    # Save HTML file
-    output_path = Path(output_dir) / str(season)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    html_file = output_path / f"matrix_{weight_class}.html"
+    # Stream HTML straight to the output file, passing starter overrides so
+    # the JS "Save Rankings" button can honor them when computing
+    # is_starter flags.
+    html_file = season_out_dir / f"matrix_{weight_class}.html"
     with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+        stream_html_matrix(
+            f,
+            matrix_data,
+            weight_class,
+            season,
+            force_backup_ids=list(force_backup_ids),
+        )
+
+    if gzip_output:
+        gz_file = html_file.with_name(html_file.name + ".gz")
+        with open(html_file, 'rb') as src, gzip.open(gz_file, 'wb', compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
     
     return html_file
 
@@ -1625,7 +1879,8 @@ def archive_rankings_snapshot(
 def generate_all_matrices(
     season: int,
     data_dir: str = "mt/rankings_data",
-    output_dir: str = "mt/rankings_html"
+    output_dir: str = "mt/rankings_html",
+    gzip_output: bool = False,
 ) -> List[Path]:
     """
     Generate HTML matrices for all weight classes.
@@ -1634,6 +1889,7 @@ def generate_all_matrices(
         season: Season year
         data_dir: Directory containing relationship files
         output_dir: Directory to save HTML files
+        gzip_output: Also write a .html.gz copy of each matrix
         
     Returns:
         List of paths to generated HTML files
@@ -1646,18 +1902,39 @@ def generate_all_matrices(
     html_files = []
     
     # Find all relationship files
-    for rel_file in sorted(data_path.glob("relationships_*.json")):
-        weight_class = rel_file.stem.replace("relationships_", "")
-        print(f"Generating matrix for weight class {weight_class}...")
-        
-        try:
-            html_file = generate_matrix_for_weight_class(
-                weight_class, season, data_dir, output_dir
+    weight_classes = [
+        rel_file.stem.replace("relationships_", "")
+        for rel_file in sorted(data_path.glob("relationships_*.json"))
+    ]
+    if not weight_classes:
+        return html_files
+
+    # Placement notes and the output directory are shared by every weight
+    # class; set them up once
+    placement_notes_map = load_placement_notes(data_dir)
+    season_out_dir = Path(output_dir) / str(season)
+    season_out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Weight classes are independent, so each one is built in its own
+    # process; results are collected in weight-class order.
+    workers = min(os.cpu_count() or 1, len(weight_classes))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [
+            ex.submit(
+                _generate_matrix_impl,
+                weight_class, season, data_path, season_out_dir,
+                placement_notes_map, gzip_output,
             )
-            html_files.append(html_file)
-            print(f"  Saved to {html_file}")
-        except Exception as e:
-            print(f"  Error: {e}")
+            for weight_class in weight_classes
+        ]
+        for weight_class, future in zip(weight_classes, futures):
+            print(f"Generating matrix for weight class {weight_class}...")
+            try:
+                html_file = future.result()
+                html_files.append(html_file)
+                print(f"  Saved to {html_file}")
+            except Exception as e:
+                print(f"  Error: {e}")
     
     return html_files
 
@@ -1670,6 +1947,7 @@ if __name__ == "__main__":
     parser.add_argument('-weight-class', help='Specific weight class to generate (default: all)')
     parser.add_argument('-data-dir', default='mt/rankings_data', help='Directory containing relationship data')
     parser.add_argument('-output-dir', default='mt/rankings_html', help='Directory to save HTML files')
+    parser.add_argument('-gzip', action='store_true', help='Also write a .html.gz copy of each matrix for static hosting')
     args = parser.parse_args()
     
     # Archive current rankings JSON files before generating matrices
@@ -1678,11 +1956,14 @@ if __name__ == "__main__":
     if args.weight_class:
         # Generate single weight class
         html_file = generate_matrix_for_weight_class(
-            args.weight_class, args.season, args.data_dir, args.output_dir
+            args.weight_class, args.season, args.data_dir, args.output_dir,
+            gzip_output=args.gzip,
         )
         print(f"Generated matrix: {html_file}")
     else:
         # Generate all weight classes
-        html_files = generate_all_matrices(args.season, args.data_dir, args.output_dir)
+        html_files = generate_all_matrices(
+            args.season, args.data_dir, args.output_dir, gzip_output=args.gzip
+        )
         print(f"\nGenerated {len(html_files)} matrix files")
 
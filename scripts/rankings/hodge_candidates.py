@@ -22,19 +22,120 @@ from __future__ import annotations
 
 import argparse
 import base64
+import gzip
 import io
 import json
+import mmap
+import os
+import pickle
+import re
+import shutil
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-
-
-BONUS_CODES = {"F", "TF", "MD", "INJ", "MFF"}
-FALL_CODES = {"F"}
-
-
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is missing: run the kernels as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+BONUS_CODES = frozenset({"F", "TF", "MD", "INJ", "MFF"})
+FALL_CODES = frozenset({"F"})
+
+# Threads used to read/parse per-weight JSON files concurrently
+LOAD_WORKERS = 8
+
+# weight_class_*.json files larger than this are streamed with ijson (when
+# installed), keeping only MATCH_FIELDS from each match
+STREAM_THRESHOLD_BYTES = 10_000_000
+MATCH_FIELDS = ("wrestler1_id", "wrestler2_id", "winner_id", "result")
+
+# JSON files larger than this are mmapped for orjson; smaller ones are cheaper
+# to read directly
+MMAP_THRESHOLD_BYTES = 1_000_000
+
+# Each weight_class_*.json gets a `.codes.npz` sidecar holding its encoded
+# match columns and the wrestler fields read here (WRESTLER_FIELDS), so warm
+# runs skip JSON parsing and result classification. Bump the version when the
+# sidecar layout or the result encoding changes.
+CODES_CACHE_VERSION = 2
+WRESTLER_FIELDS = ("name", "team")
+
+# Bump when the shape of the pickled rankings summary (.hodge_cache.pkl)
+# changes
+RANKINGS_CACHE_VERSION = 1
+
+# Integer encoding of result codes used in the per-match columns
+RESULT_CODES = ("O", "D", "MD", "TF", "F", "NC", "INJ", "MFF")
+CODE_INDEX = {code: i for i, code in enumerate(RESULT_CODES)}
+CODE_D, CODE_MD, CODE_TF, CODE_F, CODE_NC = (
+    CODE_INDEX[c] for c in ("D", "MD", "TF", "F", "NC")
+)
+IS_BONUS = np.array([c in BONUS_CODES for c in RESULT_CODES])
+IS_FALL = np.array([c in FALL_CODES for c in RESULT_CODES])
+# Team points per win for S_DOM (DEC=3, MD=4, TF=5, PIN=6; others 0)
+TEAM_POINTS = np.array([{"D": 3, "MD": 4, "TF": 5, "F": 6}.get(c, 0) for c in RESULT_CODES])
+
+# Column layout of the per-candidate counter matrix built by _tally_matches
+(
+    WINS,
+    LOSSES,
+    BONUS_WINS,
+    FALL_WINS,
+    PINS,
+    TECHS,
+    MAJORS,
+    DECISIONS,
+    RANKED_WINS,
+    TOP10_WINS,
+    RANKED_BONUS_WINS,
+    DOM_UNRANKED_MATCHES,
+) = range(12)
+N_COUNTERS = 12
+# ... and of its float S_DOM accumulator matrix
+DOM_NUM, DOM_DEN, DOM_UNRANKED_SUM = range(3)
+
+
+# One compiled pattern for classify_result_type. Each alternative is a
+# lookahead anchored at the start of the string, so the alternatives are tried
+# in priority order (first match wins, not leftmost substring) and the name of
+# the (empty) group that matched is the result code.
+_RESULT_CODE_RE = re.compile(
+    r"^(?:"
+    r"(?=.*(?:mffl|m\. for\.|medical forfeit))(?P<MFF>)"  # Medical forfeit
+    r"|(?=\s*nc\s*\Z|.*no contest)(?P<NC>)"  # No contest
+    r"|(?=.*inj)(?P<INJ>)"  # Injury-related
+    r"|(?=.*(?:fall| pin))(?P<F>)"  # Falls (non-injury)
+    r"|(?=.*(?:tf|technical fall))(?P<TF>)"  # Technical fall
+    r"|(?=.*(?:md|major))(?P<MD>)"  # Major decision
+    r"|(?=.*(?:dec|sv-))(?P<D>)"  # Regular decision (incl. sudden victory)
+    r")",
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=4096)
 def classify_result_type(result: str) -> str:
     """
     Roughly classify a result string into a simple code.
@@ -43,41 +144,121 @@ def classify_result_type(result: str) -> str:
     if not result:
         return "O"
 
-    r = result.lower()
+    m = _RESULT_CODE_RE.match(result.lower())
+    return m.lastgroup if m else "O"
 
-    # Medical forfeit
-    if "mffl" in r or "m. for." in r or "medical forfeit" in r:
-        return "MFF"
 
-    # No contest
-    clean = r.strip()
-    if clean == "nc" or "no contest" in clean:
-        return "NC"
+def _green_hex(t: float) -> str:
+    """
+    Map t in [0,1] to a light-to-dark green hex color.
+    t=0 -> very light green, t=1 -> dark green.
+    """
+    # Light and dark green RGB anchors
+    light = (230, 244, 234)  # #e6f4ea
+    dark = (21, 87, 36)      # #155724
+    r = int(light[0] + (dark[0] - light[0]) * t)
+    g = int(light[1] + (dark[1] - light[1]) * t)
+    b = int(light[2] + (dark[2] - light[2]) * t)
+    return f"#{r:02x}{g:02x}{b:02x}"
 
-    # Injury-related
-    if "inj" in r or "injury" in r:
-        return "INJ"
 
-    # Falls (non-injury)
-    if "fall" in r or " pin" in r or r.startswith("fall"):
-        return "F"
+# Green shades for t = 0.00, 0.01, ..., 1.00, and the matching opening <td>
+# tags for the report's colored cells
+GREEN_PALETTE = [_green_hex(i / 100) for i in range(101)]
+GREEN_TD_OPEN = [f"<td style='background-color:{c};'>" for c in GREEN_PALETTE]
 
-    # Technical fall
-    if "tf" in r or "technical fall" in r:
-        return "TF"
 
-    # Major decision
-    if "md" in r or "major" in r:
-        return "MD"
+def green_step(t: float) -> int:
+    """Palette index for t in [0,1] (clamped), rounded to the nearest 1% step."""
+    return max(0, min(100, round(t * 100)))
 
-    # Regular decision (incl. sudden victory)
-    if "dec" in r or "sv-" in r:
-        return "D"
 
-    return "O"
+# Static page head; filled with season/top_n/maxloss/minmatch/generated_at
+# (CSS braces doubled)
+HTML_HEAD_TEMPLATE = "\n".join(
+    [
+        "<!DOCTYPE html>",
+        "<html>",
+        "<head>",
+        "<meta charset='utf-8'>",
+        "<title>Hodge Trophy Candidates - Season {season}</title>",
+        "<style>",
+        "body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}",
+        "h1 {{ margin-top: 0; }}",
+        ".meta {{ margin-bottom: 16px; color: #555; }}",
+        "table {{ border-collapse: collapse; width: 100%; font-size: 12px; background-color: #fff; }}",
+        "th, td {{ border: 1px solid #ddd; padding: 6px 8px; text-align: center; }}",
+        "th {{ background-color: #f0f0f0; position: sticky; top: 0; z-index: 2; }}",
+        "thead th {{ white-space: nowrap; }}",
+        "tbody tr:nth-child(even) {{ background-color: #fafafa; }}",
+        "tbody tr:hover {{ background-color: #f1f7ff; }}",
+        ".name-cell {{ text-align: left; }}",
+        ".team-cell {{ text-align: left; }}",
+        "</style>",
+        "</head>",
+        "<body>",
+        "<h1>Hodge Trophy Candidates &mdash; Season {season}</h1>",
+        "<div class='meta'>",
+        "Top {top_n} per weight class; max losses={maxloss}, "
+        "min matches={minmatch}. Ranked wins and bonus stats computed "
+        "against current top-33 in the same and adjacent weights. ",
+        "Generated at {generated_at}.",
+        "</div>",
+    ]
+)
+
+# Detailed Hodge formula scores table (the "formula" view), up to <tbody>
+HTML_FORMULA_TABLE_HEAD = "\n" + "\n".join(
+    [
+        "<h2>Hodge Formula Scores (sorted by HodgeScore)</h2>",
+        "<table>",
+        "<thead>",
+        "<tr>",
+        "<th>#</th>",
+        "<th>Name</th>",
+        "<th>Team</th>",
+        "<th>Wt</th>",
+        "<th>W-L</th>",
+        "<th>Score</th>",
+        "<th>WtCl Rank</th>",
+        "<th>Quality<br>of Competition</th>",
+        "<th>Dominance Score</th>",
+        "<th>Pin%</th>",
+        "</tr>",
+        "</thead>",
+        "<tbody>",
+    ]
+)
+
+# High-level summary table, up to <tbody>
+HTML_SUMMARY_TABLE_HEAD = "\n" + "\n".join(
+    [
+        "<h2>Summary (sorted by HodgeScore)</h2>",
+        "<table>",
+        "<thead>",
+        "<tr>",
+        "<th>#</th>",
+        "<th>Name</th>",
+        "<th>Team</th>",
+        "<th>Wt</th>",
+        "<th>W-L</th>",
+        "<th>Win%</th>",
+        "<th>Bonus%</th>",
+        "<th>Fall%</th>",
+        "<th>RkW</th>",
+        "<th>Top10W</th>",
+        "<th>RkBon%</th>",
+        "</tr>",
+        "</thead>",
+        "<tbody>",
+    ]
+)
+
+HTML_TABLE_TAIL = "\n</tbody>\n</table>"
+HTML_TAIL = HTML_TABLE_TAIL + "\n</body>\n</html>"
 
 
-@dataclass
+@dataclass(slots=True)
 class HodgeStats:
     wrestler_id: str
     name: str
@@ -131,18 +312,421 @@ class HodgeStats:
         return (self.ranked_bonus_wins / self.ranked_wins) if self.ranked_wins > 0 else 0.0
 
 
+def _safe_ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Elementwise num / den, 0.0 where den == 0."""
+    return np.divide(
+        num, den, out=np.zeros(len(num), dtype=np.float64), where=den > 0
+    )
+
+
+# --- Hodge formula scores (per hodge_formula.md), over whole columns ---
+
+W_WL = 0.25
+W_REC = 0.20
+W_QUAL = 0.25
+W_DOM = 0.20
+W_PINS = 0.10
+
+
+def compute_s_wl(weight_rank: np.ndarray) -> np.ndarray:
+    # S_WL = 100 for the #1 wrestler, else max(0, 80 - 10 * (wc_rank - 2))
+    return np.where(
+        weight_rank == 1, 100.0, np.maximum(0.0, 80.0 - 10.0 * (weight_rank - 2))
+    )
+
+
+def compute_s_rec(wins: np.ndarray, losses: np.ndarray) -> np.ndarray:
+    win_pct = _safe_ratio(wins, wins + losses)
+    s = np.where(win_pct < 0.85, 0.0, np.minimum(100.0, (win_pct - 0.85) / 0.15 * 100.0))
+    s = np.where(losses == 0, np.minimum(100.0, s + 5.0), s)
+    return np.where(wins + losses > 0, s, 0.0)
+
+
+def compute_s_qual(ranked_win_ranks: List[List[int]]) -> np.ndarray:
+    n = len(ranked_win_ranks)
+    width = max((len(r) for r in ranked_win_ranks), default=0)
+    # Ranks padded with 26, which is worth 0.0 and is not a top-10 win
+    ranks_2d = np.full((n, width), 26, dtype=np.int64)
+    for i, ranks in enumerate(ranked_win_ranks):
+        ranks_2d[i, : len(ranks)] = ranks
+    values = np.where(
+        ranks_2d <= 10,
+        10.0 + (11 - ranks_2d),
+        np.where(ranks_2d <= 25, 5.0 + (26 - ranks_2d) / 3.0, 0.0),
+    )
+    # Column by column so each row sums in win order, like sum() did
+    raw_quality = np.zeros(n, dtype=np.float64)
+    for j in range(width):
+        raw_quality += values[:, j]
+    top10_wins_local = (ranks_2d <= 10).sum(axis=1)
+    s = np.minimum(100.0, (raw_quality / 120.0) * 100.0)
+    return np.minimum(100.0, s + 2.0 * np.minimum(top10_wins_local, 5))
+
+
+def compute_s_dom(
+    weighted_tp_num: np.ndarray,
+    weighted_tp_den: np.ndarray,
+    unranked_tp_sum: np.ndarray,
+    unranked_matches: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute S_DOM per s_dom_spec.txt.
+
+    - Use team-points per match (DEC=3, MD=4, TF=5, PIN=6)
+      weighted by opponent quality on a Top-50 scale.
+    - Map weighted average team points in [3.0, 6.0] to [0, 100].
+    - Optionally apply a small penalty for weak dominance vs unranked
+      opponents (avg team points < 3.2).
+    """
+    # Weighted average dominance across all opponents.
+    avg_tp_weighted = _safe_ratio(weighted_tp_num, weighted_tp_den)
+    s_dom = np.minimum(100.0, (avg_tp_weighted - 3.0) / 3.0 * 100.0)
+
+    # Optional weak-opponent penalty based on unranked dominance only.
+    avg_tp_unranked = _safe_ratio(unranked_tp_sum, unranked_matches.astype(np.float64))
+    penalty = np.minimum(10.0, (3.2 - avg_tp_unranked) * 10.0)
+    s_dom = np.where(
+        (unranked_matches > 0) & (avg_tp_unranked < 3.2),
+        np.maximum(0.0, s_dom - penalty),
+        s_dom,
+    )
+    return np.where((weighted_tp_den > 0.0) & (avg_tp_weighted > 3.0), s_dom, 0.0)
+
+
+def compute_s_pins(pins: np.ndarray, wins: np.ndarray) -> np.ndarray:
+    pin_pct = _safe_ratio(pins, wins)
+    s = np.where(pin_pct >= 0.60, 100.0, (pin_pct - 0.10) / 0.50 * 100.0)
+    return np.where((wins > 0) & (pins > 0) & (pin_pct > 0.10), s, 0.0)
+
+
+class HodgeTable:
+    """
+    Column-oriented table of Hodge candidates (struct-of-arrays).
+
+    Counters live in one (n, N_COUNTERS) matrix and the S_DOM accumulators
+    in one (n, 3) matrix, both using the _tally_matches column layout;
+    per-wrestler metadata and ranked-win ranks are kept in parallel lists.
+    Filters, scores and the sort order are computed over whole columns, and
+    HodgeStats rows are only materialized for printing/HTML.
+    """
+
+    __slots__ = (
+        "wrestler_ids",
+        "names",
+        "teams",
+        "weight_classes",
+        "weight_rank",
+        "counts",
+        "dom",
+        "ranked_win_ranks",
+        "scores",
+    )
+
+    # Column layout of the (n, 6) scores matrix
+    SCORE_FIELDS = ("s_wl", "s_rec", "s_qual", "s_dom", "s_pins", "hodge_score")
+
+    def __init__(
+        self,
+        wrestler_ids: List[str],
+        names: List[str],
+        teams: List[str],
+        weight_classes: List[str],
+        weight_rank: np.ndarray,
+        counts: np.ndarray,
+        dom: np.ndarray,
+        ranked_win_ranks: List[List[int]],
+        scores: Optional[np.ndarray] = None,
+    ) -> None:
+        self.wrestler_ids = wrestler_ids
+        self.names = names
+        self.teams = teams
+        self.weight_classes = weight_classes
+        self.weight_rank = weight_rank
+        self.counts = counts
+        self.dom = dom
+        self.ranked_win_ranks = ranked_win_ranks
+        self.scores = (
+            scores
+            if scores is not None
+            else np.zeros((len(wrestler_ids), len(self.SCORE_FIELDS)), dtype=np.float64)
+        )
+
+    @classmethod
+    def empty(cls) -> "HodgeTable":
+        return cls(
+            [], [], [], [],
+            np.zeros(0, dtype=np.int64),
+            np.zeros((0, N_COUNTERS), dtype=np.int64),
+            np.zeros((0, 3), dtype=np.float64),
+            [],
+        )
+
+    @classmethod
+    def concat(cls, parts: List["HodgeTable"]) -> "HodgeTable":
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        return cls(
+            [x for p in parts for x in p.wrestler_ids],
+            [x for p in parts for x in p.names],
+            [x for p in parts for x in p.teams],
+            [x for p in parts for x in p.weight_classes],
+            np.concatenate([p.weight_rank for p in parts]),
+            np.concatenate([p.counts for p in parts]),
+            np.concatenate([p.dom for p in parts]),
+            [x for p in parts for x in p.ranked_win_ranks],
+            np.concatenate([p.scores for p in parts]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.wrestler_ids)
+
+    def take(self, idx: np.ndarray) -> "HodgeTable":
+        """Rows at the given indices (or boolean mask), in that order."""
+        idx = np.arange(len(self))[idx]
+        return HodgeTable(
+            [self.wrestler_ids[i] for i in idx],
+            [self.names[i] for i in idx],
+            [self.teams[i] for i in idx],
+            [self.weight_classes[i] for i in idx],
+            self.weight_rank[idx],
+            self.counts[idx],
+            self.dom[idx],
+            [self.ranked_win_ranks[i] for i in idx],
+            self.scores[idx],
+        )
+
+    @property
+    def wins(self) -> np.ndarray:
+        return self.counts[:, WINS]
+
+    @property
+    def losses(self) -> np.ndarray:
+        return self.counts[:, LOSSES]
+
+    @property
+    def total_matches(self) -> np.ndarray:
+        return self.counts[:, WINS] + self.counts[:, LOSSES]
+
+    @property
+    def hodge_score(self) -> np.ndarray:
+        return self.scores[:, -1]
+
+    def compute_scores(self) -> None:
+        """Fill the scores matrix with the Hodge formula components."""
+        s_wl = compute_s_wl(self.weight_rank)
+        s_rec = compute_s_rec(self.wins, self.losses)
+        s_qual = compute_s_qual(self.ranked_win_ranks)
+        s_dom = compute_s_dom(
+            self.dom[:, DOM_NUM],
+            self.dom[:, DOM_DEN],
+            self.dom[:, DOM_UNRANKED_SUM],
+            self.counts[:, DOM_UNRANKED_MATCHES],
+        )
+        s_pins = compute_s_pins(self.counts[:, PINS], self.wins)
+        hodge_score = (
+            W_WL * s_wl
+            + W_REC * s_rec
+            + W_QUAL * s_qual
+            + W_DOM * s_dom
+            + W_PINS * s_pins
+        )
+        self.scores = np.column_stack([s_wl, s_rec, s_qual, s_dom, s_pins, hodge_score])
+
+    def sort_order(self) -> np.ndarray:
+        """
+        Indices sorted by overall Hodge formula score (desc), then by weight
+        rank. np.lexsort is stable, so ties keep weight order like sorted() did.
+        """
+        return np.lexsort((self.weight_rank, -self.hodge_score))
+
+    def row(self, i: int) -> HodgeStats:
+        c = self.counts[i].tolist()
+        d = self.dom[i].tolist()
+        sc = self.scores[i].tolist()
+        return HodgeStats(
+            wrestler_id=self.wrestler_ids[i],
+            name=self.names[i],
+            team=self.teams[i],
+            weight_class=self.weight_classes[i],
+            weight_rank=int(self.weight_rank[i]),
+            wins=c[WINS],
+            losses=c[LOSSES],
+            bonus_wins=c[BONUS_WINS],
+            fall_wins=c[FALL_WINS],
+            ranked_wins=c[RANKED_WINS],
+            top10_wins=c[TOP10_WINS],
+            ranked_bonus_wins=c[RANKED_BONUS_WINS],
+            decisions=c[DECISIONS],
+            majors=c[MAJORS],
+            techs=c[TECHS],
+            pins=c[PINS],
+            ranked_win_ranks=list(self.ranked_win_ranks[i]),
+            dom_weighted_tp_num=d[DOM_NUM],
+            dom_weighted_tp_den=d[DOM_DEN],
+            dom_unranked_tp_sum=d[DOM_UNRANKED_SUM],
+            dom_unranked_matches=c[DOM_UNRANKED_MATCHES],
+            **dict(zip(self.SCORE_FIELDS, sc)),
+        )
+
+
+def build_match_columns(wc_data: Dict) -> Dict:
+    """
+    Encode a weight class's matches as parallel NumPy columns:
+      - "ids": dense index -> wrestler_id, "index": wrestler_id -> dense index
+      - "w1", "w2", "winner": int32 dense indices (-1 when missing)
+      - "code": int8 result code (RESULT_CODES order), classified once here
+    """
+    matches: List[Dict] = wc_data.get("matches", [])
+    index: Dict[str, int] = {}
+
+    # Bound once outside the per-match loop
+    dense = index.setdefault
+    classify = classify_result_type
+    code_index = CODE_INDEX
+    w1: List[int] = []
+    w2: List[int] = []
+    winner: List[int] = []
+    code: List[int] = []
+    for m in matches:
+        get = m.get
+        a = get("wrestler1_id")
+        b = get("wrestler2_id")
+        c = get("winner_id")
+        w1.append(-1 if a is None else dense(a, len(index)))
+        w2.append(-1 if b is None else dense(b, len(index)))
+        winner.append(-1 if c is None else dense(c, len(index)))
+        code.append(code_index[classify(get("result", "") or "")])
+    return {
+        "ids": list(index),
+        "index": index,
+        "w1": np.array(w1, dtype=np.int32),
+        "w2": np.array(w2, dtype=np.int32),
+        "winner": np.array(winner, dtype=np.int32),
+        "code": np.array(code, dtype=np.int8),
+    }
+
+
+def _parse_json_file(path: Path):
+    """
+    Parse a JSON file, with orjson when installed. Files over
+    MMAP_THRESHOLD_BYTES are memory-mapped and handed to orjson as a buffer
+    instead of being read into a bytes copy first.
+    """
+    if orjson is not None and path.stat().st_size > MMAP_THRESHOLD_BYTES:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _stream_weight_class(path: Path) -> Dict:
+    """
+    Stream a large weight_class_*.json with ijson (C backend if available),
+    building the wrestlers dict and slim match dicts (MATCH_FIELDS only)
+    without materializing the full document first.
+    """
+    try:
+        backend = ijson.get_backend("yajl2_c")
+    except ImportError:
+        backend = ijson
+
+    with path.open("rb") as f:
+        wrestlers = dict(backend.kvitems(f, "wrestlers", use_float=True))
+        f.seek(0)
+        matches = [
+            {field: m.get(field) for field in MATCH_FIELDS}
+            for m in backend.items(f, "matches.item", use_float=True)
+        ]
+    return {"wrestlers": wrestlers, "matches": matches}
+
+
+def _load_weight_class(wc_file: Path) -> Dict:
+    """
+    Load one weight_class_*.json as its wrestlers (WRESTLER_FIELDS only) and
+    encoded match columns (see build_match_columns).
+
+    The result is memoized in a sibling `.codes.npz` sidecar, reused only when
+    it was written with the current CODES_CACHE_VERSION from a source with the
+    same (mtime_ns, size) as now; otherwise the JSON is parsed and classified
+    and the sidecar is rewritten atomically.
+    """
+    sidecar = wc_file.with_suffix(".codes.npz")
+    stat = wc_file.stat()
+    try:
+        with np.load(sidecar, allow_pickle=False) as npz:
+            if (
+                int(npz["version"]) == CODES_CACHE_VERSION
+                and int(npz["src_mtime_ns"]) == stat.st_mtime_ns
+                and int(npz["src_size"]) == stat.st_size
+            ):
+                ids = npz["ids"].tolist()
+                return {
+                    "wrestlers": json.loads(str(npz["wrestlers"])),
+                    "match_columns": {
+                        "ids": ids,
+                        "index": {wid: i for i, wid in enumerate(ids)},
+                        "w1": npz["w1"],
+                        "w2": npz["w2"],
+                        "winner": npz["winner"],
+                        "code": npz["code"],
+                    },
+                }
+    except (OSError, KeyError, ValueError):
+        pass
+
+    if ijson is not None and stat.st_size > STREAM_THRESHOLD_BYTES:
+        wc_data = _stream_weight_class(wc_file)
+    else:
+        wc_data = _parse_json_file(wc_file)
+    wrestlers = {
+        wid: {k: info[k] for k in WRESTLER_FIELDS if k in info}
+        for wid, info in wc_data.get("wrestlers", {}).items()
+    }
+    cols = build_match_columns(wc_data)
+
+    # Only string IDs round-trip through the sidecar's text array
+    if all(isinstance(wid, str) for wid in cols["ids"]):
+        tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                np.savez(
+                    f,
+                    version=np.array(CODES_CACHE_VERSION),
+                    src_mtime_ns=np.array(stat.st_mtime_ns, dtype=np.int64),
+                    src_size=np.array(stat.st_size, dtype=np.int64),
+                    ids=np.array(cols["ids"], dtype=str),
+                    wrestlers=np.array(json.dumps(wrestlers)),
+                    w1=cols["w1"],
+                    w2=cols["w2"],
+                    winner=cols["winner"],
+                    code=cols["code"],
+                )
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            # Read-only data dir etc.: caching is best-effort.
+            pass
+    return {"wrestlers": wrestlers, "match_columns": cols}
+
+
 def load_weight_classes(season: int, data_dir: str) -> Dict[str, Dict]:
-    """Load all `weight_class_*.json` files for a season."""
+    """
+    Load all `weight_class_*.json` files for a season as
+    {"wrestlers", "match_columns"} dicts (see _load_weight_class).
+    """
     base = Path(data_dir) / str(season)
     if not base.exists():
         raise FileNotFoundError(f"Data directory not found: {base}")
 
-    result: Dict[str, Dict] = {}
-    for wc_file in sorted(base.glob("weight_class_*.json")):
-        weight = wc_file.stem.replace("weight_class_", "")
-        with wc_file.open("r", encoding="utf-8") as f:
-            result[weight] = json.load(f)
-    return result
+    wc_files = sorted(base.glob("weight_class_*.json"))
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+        loaded = ex.map(_load_weight_class, wc_files)
+        return {
+            wc_file.stem.replace("weight_class_", ""): data
+            for wc_file, data in zip(wc_files, loaded)
+        }
 
 
 def load_rankings_for_weight(
@@ -155,157 +739,312 @@ def load_rankings_for_weight(
     rankings_path = Path(data_dir) / str(season) / f"rankings_{weight}.json"
     if not rankings_path.exists():
         return None
-    with rankings_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _parse_json_file(rankings_path)
     return data.get("rankings", [])
 
 
+def _summarize_rankings(
+    season: int, data_dir: str, weights: List[str]
+) -> Tuple[
+    Dict[str, Optional[List[Dict]]],
+    Dict[str, FrozenSet[str]],
+    Dict[str, FrozenSet[str]],
+    Dict[str, int],
+]:
+    """Load every weight's rankings and derive the sets used for scoring."""
+    rankings_by_weight: Dict[str, Optional[List[Dict]]] = {}
+    top10_ids_by_weight: Dict[str, FrozenSet[str]] = {}
+    top33_ids_by_weight: Dict[str, FrozenSet[str]] = {}
+    global_rank_lookup: Dict[str, int] = {}
+
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+        loaded_rankings = list(
+            ex.map(lambda w: load_rankings_for_weight(season, w, data_dir), weights)
+        )
+
+    for weight, rankings in zip(weights, loaded_rankings):
+        rankings_by_weight[weight] = rankings
+        top10: Set[str] = set()
+        top33: Set[str] = set()
+        if rankings:
+            for entry in rankings:
+                wid = entry.get("wrestler_id")
+                rank = entry.get("rank")
+                if not wid or rank is None:
+                    continue
+                try:
+                    r = int(rank)
+                except (TypeError, ValueError):
+                    continue
+                if r <= 10:
+                    top10.add(wid)
+                if r <= 33:
+                    top33.add(wid)
+                # Track global best rank for quality/weight-class scoring
+                if wid not in global_rank_lookup or r < global_rank_lookup[wid]:
+                    global_rank_lookup[wid] = r
+        top10_ids_by_weight[weight] = frozenset(top10)
+        top33_ids_by_weight[weight] = frozenset(top33)
+
+    return rankings_by_weight, top10_ids_by_weight, top33_ids_by_weight, global_rank_lookup
+
+
+def load_rankings_summary(season: int, data_dir: str, weights: List[str]):
+    """
+    Return (rankings_by_weight, top10_ids_by_weight, top33_ids_by_weight,
+    global_rank_lookup) for the given weights, memoized in
+    `{data_dir}/{season}/.hodge_cache.pkl`.
+
+    The pickle is keyed by RANKINGS_CACHE_VERSION and the weights'
+    rankings_*.json (mtime_ns, size), so it is rebuilt whenever a rankings
+    file is added, removed or rewritten; writes are atomic and best-effort.
+    """
+    base = Path(data_dir) / str(season)
+    key = [RANKINGS_CACHE_VERSION]
+    for weight in weights:
+        try:
+            st = (base / f"rankings_{weight}.json").stat()
+            key.append((weight, st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append((weight, None))
+    key = tuple(key)
+
+    cache_path = base / ".hodge_cache.pkl"
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, summary = pickle.load(f)
+        if cached_key == key:
+            return summary
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+
+    summary = _summarize_rankings(season, data_dir, weights)
+
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump((key, summary), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only data dir etc.: caching is best-effort.
+        pass
+    return summary
+
+
+@njit(cache=True)
+def _tally_matches(
+    w1,
+    w2,
+    winner,
+    code,
+    slot_of,
+    opp_rank,
+    has_rank,
+    opp_ranked,
+    opp_top10,
+    is_bonus,
+    is_fall,
+    team_points,
+    n_tracked,
+):
+    """
+    Accumulate per-candidate stats over integer-encoded match columns.
+    w1/w2/winner hold dense wrestler indices (-1 if missing); slot_of maps a
+    dense index to the candidate slot (-1 if untracked) and the opp_* /
+    has_rank arrays describe each wrestler as an opponent. The last entry
+    of every per-wrestler array stands for a missing ID.
+
+    Returns (counts, dom, win_rank_slots, win_ranks): an (n_tracked,
+    N_COUNTERS) int64 counter matrix, an (n_tracked, 3) float64 S_DOM
+    accumulator matrix, and the candidate slot and opponent rank of each
+    ranked win over a top-25 opponent, in match order.
+    """
+    counts = np.zeros((n_tracked, N_COUNTERS), dtype=np.int64)
+    dom = np.zeros((n_tracked, 3), dtype=np.float64)
+    win_rank_slots = np.empty(2 * w1.shape[0], dtype=np.int64)
+    win_ranks = np.empty(2 * w1.shape[0], dtype=np.int64)
+    n_ranks = 0
+    for i in range(w1.shape[0]):
+        c = code[i]
+        # Skip NC for win/loss accounting
+        if c == CODE_NC:
+            continue
+        for side in range(2):
+            if side == 0:
+                me = w1[i]
+                opp = w2[i]
+            else:
+                me = w2[i]
+                opp = w1[i]
+            k = slot_of[me]
+            if k < 0:
+                continue
+            if winner[i] != me:
+                counts[k, LOSSES] += 1
+                continue
+
+            counts[k, WINS] += 1
+            bonus = is_bonus[c]
+            counts[k, BONUS_WINS] += bonus
+            counts[k, FALL_WINS] += is_fall[c]
+
+            # Dominance detail by result type
+            if c == CODE_F:
+                counts[k, PINS] += 1
+            elif c == CODE_TF:
+                counts[k, TECHS] += 1
+            elif c == CODE_MD:
+                counts[k, MAJORS] += 1
+            elif c == CODE_D:
+                counts[k, DECISIONS] += 1
+
+            # Dominance accumulators for S_DOM (team points weighted by opponent rank)
+            tp = team_points[c]
+            rank = opp_rank[opp]
+            ranked = has_rank[opp]
+            if tp > 0:
+                if ranked and 1 <= rank <= 50:
+                    weight = 1.0 + (50.0 - rank) / 49.0
+                else:
+                    weight = 0.50
+                dom[k, DOM_NUM] += tp * weight
+                dom[k, DOM_DEN] += weight
+
+                # Track unranked dominance separately for optional penalty
+                if not ranked or rank > 50:
+                    dom[k, DOM_UNRANKED_SUM] += tp
+                    counts[k, DOM_UNRANKED_MATCHES] += 1
+
+            # Ranked opponent metrics (current top-33 in same/adjacent weights)
+            if opp_ranked[opp]:
+                counts[k, RANKED_WINS] += 1
+                counts[k, RANKED_BONUS_WINS] += bonus
+                counts[k, TOP10_WINS] += opp_top10[opp]
+
+                # For quality-of-competition scoring we also record the
+                # actual rank (1-25) of each ranked opponent win when known.
+                if ranked and rank <= 25:
+                    win_rank_slots[n_ranks] = k
+                    win_ranks[n_ranks] = rank
+                    n_ranks += 1
+    return counts, dom, win_rank_slots[:n_ranks], win_ranks[:n_ranks]
+
+
+def _dense_flags(ids: FrozenSet[str], index: Dict[str, int], n: int) -> np.ndarray:
+    """Boolean array over dense wrestler indices, True for the given IDs."""
+    flags = np.zeros(n, dtype=np.bool_)
+    flags[[index[wid] for wid in ids if wid and wid in index]] = True
+    return flags
+
+
 def compute_stats_for_weight(
     weight: str,
     wc_data: Dict,
     rankings: Optional[List[Dict]],
-    ranked_opponent_ids: Set[str],
-    top10_opponent_ids: Set[str],
+    ranked_opponent_ids: FrozenSet[str],
+    top10_opponent_ids: FrozenSet[str],
     rank_lookup: Dict[str, int],
     top_n: int = 10,
     starters_only: bool = False,
-) -> List[HodgeStats]:
+) -> HodgeTable:
     """
-    Compute HodgeStats for ranked wrestlers in a single weight.
+    Compute a HodgeTable for ranked wrestlers in a single weight.
     
     If starters_only is True, only wrestlers explicitly marked as starters
     in the rankings JSON (entry['is_starter'] == True) are considered when
     building the candidate list for that weight.
     """
     wrestlers: Dict[str, Dict] = wc_data["wrestlers"]
-    matches: List[Dict] = wc_data["matches"]
 
     if not rankings:
-        return []
+        return HodgeTable.empty()
 
-    # Map wrestler_id -> overall rank
+    # One pass over the rankings builds both the wrestler_id -> overall rank
+    # map (all entries) and the ranked wrestler IDs (respect their order,
+    # first top_n), optionally restricted to official starters only.
     rank_by_id: Dict[str, int] = {}
-    for entry in rankings:
-        wid = entry.get("wrestler_id")
-        rank = entry.get("rank")
-        if not wid or rank is None:
-            continue
-        try:
-            r = int(rank)
-        except (TypeError, ValueError):
-            continue
-        rank_by_id[wid] = r
-
-    # Collect ranked wrestler IDs (respect their order), optionally
-    # restricted to official starters only.
     top_ranked_ids: List[str] = []
+    topped_up = False
     for entry in rankings:
-        wid = entry.get("wrestler_id")
-        if not wid or wid not in wrestlers:
+        get = entry.get
+        wid = get("wrestler_id")
+        if not wid:
             continue
-        if starters_only and not entry.get("is_starter", False):
+        rank = get("rank")
+        if rank is not None:
+            try:
+                rank_by_id[wid] = int(rank)
+            except (TypeError, ValueError):
+                pass
+        if topped_up or wid not in wrestlers:
+            continue
+        if starters_only and not get("is_starter", False):
             continue
         top_ranked_ids.append(wid)
-        if len(top_ranked_ids) >= top_n:
-            break
+        topped_up = len(top_ranked_ids) >= top_n
 
     if not top_ranked_ids:
-        return []
-
-    # Initialize stats for those wrestlers
-    stats: Dict[str, HodgeStats] = {}
-    for wid in top_ranked_ids:
-        info = wrestlers[wid]
-        stats[wid] = HodgeStats(
-            wrestler_id=wid,
-            name=info.get("name", f"ID:{wid}"),
-            team=info.get("team", "Unknown"),
-            weight_class=weight,
-            weight_rank=rank_by_id.get(wid, 999),
-        )
-
-    # Iterate matches once and update stats for involved top-10 wrestlers
-    for m in matches:
-        w1 = m.get("wrestler1_id")
-        w2 = m.get("wrestler2_id")
-        winner = m.get("winner_id")
-        result = m.get("result", "") or ""
-        code = classify_result_type(result)
-
-        # Only process matches that involve at least one tracked wrestler
-        if w1 not in stats and w2 not in stats:
-            continue
-
-        # Skip NC for win/loss accounting
-        if code == "NC":
-            continue
-
-        # Helper to update stats for one side of the match
-        def update_for(wid: str, opp_id: Optional[str]) -> None:
-            if wid not in stats:
-                return
-            s = stats[wid]
-            if winner == wid:
-                s.wins += 1
-                if code in BONUS_CODES:
-                    s.bonus_wins += 1
-                if code in FALL_CODES:
-                    s.fall_wins += 1
-
-                # Dominance detail by result type
-                if code == "F":
-                    s.pins += 1
-                elif code == "TF":
-                    s.techs += 1
-                elif code == "MD":
-                    s.majors += 1
-                elif code == "D":
-                    s.decisions += 1
-
-                # Dominance accumulators for S_DOM (team points weighted by opponent rank)
-                tp = 0
-                if code == "D":
-                    tp = 3
-                elif code == "MD":
-                    tp = 4
-                elif code == "TF":
-                    tp = 5
-                elif code == "F":
-                    tp = 6
-                if tp > 0:
-                    opp_rank = rank_lookup.get(opp_id) if opp_id else None
-                    if opp_rank is not None and 1 <= opp_rank <= 50:
-                        weight = 1.0 + (50.0 - float(opp_rank)) / 49.0
-                    else:
-                        weight = 0.50
-                    s.dom_weighted_tp_num += tp * weight
-                    s.dom_weighted_tp_den += weight
-
-                    # Track unranked dominance separately for optional penalty
-                    if opp_rank is None or opp_rank > 50:
-                        s.dom_unranked_tp_sum += tp
-                        s.dom_unranked_matches += 1
-
-                # Ranked opponent metrics (current top-33 in same/adjacent weights)
-                if opp_id and opp_id in ranked_opponent_ids:
-                    s.ranked_wins += 1
-                    if code in BONUS_CODES:
-                        s.ranked_bonus_wins += 1
-                    if opp_id in top10_opponent_ids:
-                        s.top10_wins += 1
-
-                    # For quality-of-competition scoring we also record the
-                    # actual rank (1-25) of each ranked opponent win when known.
-                    opp_rank = rank_lookup.get(opp_id)
-                    if opp_rank is not None and opp_rank <= 25:
-                        s.ranked_win_ranks.append(opp_rank)
-            else:
-                s.losses += 1
-
-        update_for(w1, w2)
-        update_for(w2, w1)
+        return HodgeTable.empty()
+
+    # Candidates in ranking order (a wrestler listed twice is tracked once)
+    tracked = list(dict.fromkeys(top_ranked_ids))
+
+    # Encoded match columns built at load time
+    cols = wc_data["match_columns"]
+    col_ids: List[str] = cols["ids"]
+    slot_of = np.full(len(col_ids) + 1, -1, dtype=np.int64)  # [-1] -> missing
+    for k, wid in enumerate(tracked):
+        i = cols["index"].get(wid)
+        if i is not None:
+            slot_of[i] = k
+
+    # Opponent lookups per dense wrestler index (last entry: missing ID),
+    # scattered from the small rank/ranked-ID collections via the index
+    index: Dict[str, int] = cols["index"]
+    n_ids = len(col_ids) + 1
+    rank_hits = [(index[wid], r) for wid, r in rank_lookup.items() if wid and wid in index]
+    opp_rank = np.zeros(n_ids, dtype=np.int64)
+    has_rank = np.zeros(n_ids, dtype=np.bool_)
+    if rank_hits:
+        hit_idx, hit_rank = zip(*rank_hits)
+        opp_rank[list(hit_idx)] = hit_rank
+        has_rank[list(hit_idx)] = True
+    opp_ranked = _dense_flags(ranked_opponent_ids, index, n_ids)
+    opp_top10 = _dense_flags(top10_opponent_ids, index, n_ids)
+
+    # Only hand the kernel matches that involve a tracked wrestler
+    w1, w2 = cols["w1"], cols["w2"]
+    relevant = np.flatnonzero((slot_of[w1] >= 0) | (slot_of[w2] >= 0))
+    counts, dom, win_rank_slots, win_ranks = _tally_matches(
+        w1[relevant],
+        w2[relevant],
+        cols["winner"][relevant],
+        cols["code"][relevant],
+        slot_of,
+        opp_rank,
+        has_rank,
+        opp_ranked,
+        opp_top10,
+        IS_BONUS,
+        IS_FALL,
+        TEAM_POINTS,
+        len(tracked),
+    )
 
-    return list(stats.values())
+    ranked_win_ranks: List[List[int]] = [[] for _ in tracked]
+    for k, r in zip(win_rank_slots.tolist(), win_ranks.tolist()):
+        ranked_win_ranks[k].append(r)
+
+    return HodgeTable(
+        tracked,
+        [wrestlers[wid].get("name", f"ID:{wid}") for wid in tracked],
+        [wrestlers[wid].get("team", "Unknown") for wid in tracked],
+        [weight] * len(tracked),
+        np.array([rank_by_id.get(wid, 999) for wid in tracked], dtype=np.int64),
+        counts,
+        dom,
+        ranked_win_ranks,
+    )
 
 
 def main() -> None:
@@ -350,6 +1089,11 @@ def main() -> None:
             "(default: 1; set to 0 to include 0-0 wrestlers)."
         ),
     )
+    parser.add_argument(
+        "-gzip",
+        action="store_true",
+        help="Also write a .html.gz copy of the report for static hosting",
+    )
     args = parser.parse_args()
 
     season = args.season
@@ -364,44 +1108,18 @@ def main() -> None:
         key=lambda w: int(w),
     )
 
-    # Preload rankings and build top-10 / top-33 sets per weight
-    rankings_by_weight: Dict[str, Optional[List[Dict]]] = {}
-    top10_ids_by_weight: Dict[str, Set[str]] = {}
-    top33_ids_by_weight: Dict[str, Set[str]] = {}
-    # Global rank lookup (wid -> best rank across all weights)
-    global_rank_lookup: Dict[str, int] = {}
-
-    for weight in numeric_weights:
-        rankings = load_rankings_for_weight(season, weight, data_dir)
-        rankings_by_weight[weight] = rankings
-        top10: Set[str] = set()
-        top33: Set[str] = set()
-        if rankings:
-            for entry in rankings:
-                wid = entry.get("wrestler_id")
-                rank = entry.get("rank")
-                if not wid or rank is None:
-                    continue
-                try:
-                    r = int(rank)
-                except (TypeError, ValueError):
-                    continue
-                if r <= 10:
-                    top10.add(wid)
-                if r <= 33:
-                    top33.add(wid)
-                # Track global best rank for quality/weight-class scoring
-                if wid not in global_rank_lookup or r < global_rank_lookup[wid]:
-                    global_rank_lookup[wid] = r
-        top10_ids_by_weight[weight] = top10
-        top33_ids_by_weight[weight] = top33
-
-    all_candidates: List[HodgeStats] = []
-    # For histograms: stats for all ranked (top-33) starters across weights
-    all_ranked_for_hist: List[HodgeStats] = []
+    # Rankings and the top-10 / top-33 sets per weight, plus the global rank
+    # lookup (wid -> best rank across all weights)
+    (
+        rankings_by_weight,
+        top10_ids_by_weight,
+        top33_ids_by_weight,
+        global_rank_lookup,
+    ) = load_rankings_summary(season, data_dir, numeric_weights)
 
     # For each weight, build the set of ranked/top10 opponent IDs from
     # the current and adjacent weight classes only.
+    tasks = []
     for idx, weight in enumerate(numeric_weights):
         wc_data = wc_by_weight[weight]
         rankings = rankings_by_weight.get(weight)
@@ -414,188 +1132,51 @@ def main() -> None:
         if idx < len(numeric_weights) - 1:
             neighbor_weights.append(numeric_weights[idx + 1])
 
-        ranked_ids: Set[str] = set()
-        top10_ids: Set[str] = set()
-        for w in neighbor_weights:
-            ranked_ids.update(top33_ids_by_weight.get(w, set()))
-            top10_ids.update(top10_ids_by_weight.get(w, set()))
-
-        # For primary Hodge candidate list, use only official starters.
-        stats_starters = compute_stats_for_weight(
-            weight,
-            wc_data,
-            rankings,
-            ranked_ids,
-            top10_ids,
-            global_rank_lookup,
-            top_n=args.top_n,
-            starters_only=True,
-        )
-        all_candidates.extend(stats_starters)
-
-        # For histograms: collect stats for all starters ranked in the top-33
-        starter_rankings_33: List[Dict] = []
-        if rankings:
-            for entry in rankings:
-                if not entry.get("is_starter", False):
-                    continue
-                wid = entry.get("wrestler_id")
-                rank = entry.get("rank")
-                if not wid or rank is None:
-                    continue
-                try:
-                    r = int(rank)
-                except (TypeError, ValueError):
-                    continue
-                if r <= 33:
-                    starter_rankings_33.append(entry)
+        empty: FrozenSet[str] = frozenset()
+        ranked_ids = empty.union(*(top33_ids_by_weight.get(w, empty) for w in neighbor_weights))
+        top10_ids = empty.union(*(top10_ids_by_weight.get(w, empty) for w in neighbor_weights))
 
-        if starter_rankings_33:
-            hist_stats = compute_stats_for_weight(
+        # Workers get the ranks of only the wrestlers in this weight's matches
+        cols = wc_data["match_columns"]
+        tasks.append(
+            (
                 weight,
                 wc_data,
-                starter_rankings_33,
+                rankings,
                 ranked_ids,
                 top10_ids,
-                global_rank_lookup,
-                top_n=len(starter_rankings_33),
-                starters_only=True,
+                {wid: global_rank_lookup[wid] for wid in cols["ids"] if wid in global_rank_lookup},
             )
-            all_ranked_for_hist.extend(hist_stats)
+        )
+
+    # Weight classes are independent, so each one is computed in its own
+    # process; results are collected in weight order. For the primary Hodge
+    # candidate list, use only official starters.
+    candidate_parts: List[HodgeTable] = []
+    if tasks:
+        workers = min(os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(compute_stats_for_weight, *task, top_n=args.top_n, starters_only=True)
+                for task in tasks
+            ]
+            candidate_parts = [future.result() for future in futures]
 
     # Apply loss and match-count filters
-    filtered_candidates: List[HodgeStats] = [
-        s
-        for s in all_candidates
-        if s.losses <= args.maxloss and s.total_matches >= args.minmatch
-    ]
+    all_candidates = HodgeTable.concat(candidate_parts)
+    filtered_candidates = all_candidates.take(
+        (all_candidates.losses <= args.maxloss)
+        & (all_candidates.total_matches >= args.minmatch)
+    )
 
     # --- Compute numeric Hodge scores (per hodge_formula.md) ---
+    filtered_candidates.compute_scores()
 
-    def compute_s_wl(rank_val: int) -> float:
-        if rank_val == 1:
-            return 100.0
-        # S_WL = max(0, 80 - 10 * (wc_rank - 2))
-        return max(0.0, 80.0 - 10.0 * (rank_val - 2))
-
-    def compute_s_rec(wins: int, losses: int) -> float:
-        total = wins + losses
-        if total <= 0:
-            return 0.0
-        win_pct = wins / total
-        if win_pct < 0.85:
-            s = 0.0
-        else:
-            s = min(100.0, (win_pct - 0.85) / 0.15 * 100.0)
-        if losses == 0:
-            s = min(100.0, s + 5.0)
-        return s
-
-    def value_for_rank(r: Optional[int]) -> float:
-        if r is None:
-            return 0.0
-        if r <= 10:
-            return 10.0 + (11 - r)
-        if r <= 25:
-            return 5.0 + (26 - r) / 3.0
-        return 0.0
-
-    def compute_s_qual(ranks: List[int]) -> float:
-        if not ranks:
-            return 0.0
-        raw_quality = sum(value_for_rank(r) for r in ranks)
-        top10_wins_local = sum(1 for r in ranks if r <= 10)
-        s = min(100.0, (raw_quality / 120.0) * 100.0)
-        s = min(100.0, s + 2.0 * min(top10_wins_local, 5))
-        return s
-
-    def compute_s_dom(
-        weighted_tp_num: float,
-        weighted_tp_den: float,
-        unranked_tp_sum: float,
-        unranked_matches: int,
-    ) -> float:
-        """
-        Compute S_DOM per s_dom_spec.txt.
-
-        - Use team-points per match (DEC=3, MD=4, TF=5, PIN=6)
-          weighted by opponent quality on a Top-50 scale.
-        - Map weighted average team points in [3.0, 6.0] to [0, 100].
-        - Optionally apply a small penalty for weak dominance vs unranked
-          opponents (avg team points < 3.2).
-        """
-        if weighted_tp_den <= 0.0:
-            return 0.0
-
-        # Weighted average dominance across all opponents.
-        avg_tp_weighted = weighted_tp_num / weighted_tp_den
-        if avg_tp_weighted <= 3.0:
-            return 0.0
-
-        s_dom = min(100.0, (avg_tp_weighted - 3.0) / 3.0 * 100.0)
-
-        # Optional weak-opponent penalty based on unranked dominance only.
-        if unranked_matches > 0:
-            avg_tp_unranked = unranked_tp_sum / float(unranked_matches)
-            if avg_tp_unranked < 3.2:
-                penalty = min(10.0, (3.2 - avg_tp_unranked) * 10.0)
-                s_dom = max(0.0, s_dom - penalty)
-
-        return s_dom
-
-    def compute_s_pins(pins: int, wins: int) -> float:
-        if wins <= 0 or pins <= 0:
-            return 0.0
-        pin_pct = pins / wins
-        if pin_pct <= 0.10:
-            return 0.0
-        if pin_pct >= 0.60:
-            return 100.0
-        return (pin_pct - 0.10) / 0.50 * 100.0
-
-    W_WL = 0.25
-    W_REC = 0.20
-    W_QUAL = 0.25
-    W_DOM = 0.20
-    W_PINS = 0.10
-
-    for s in filtered_candidates:
-        s.s_wl = compute_s_wl(s.weight_rank)
-        s.s_rec = compute_s_rec(s.wins, s.losses)
-        s.s_qual = compute_s_qual(s.ranked_win_ranks)
-        s.s_dom = compute_s_dom(
-            s.dom_weighted_tp_num,
-            s.dom_weighted_tp_den,
-            s.dom_unranked_tp_sum,
-            s.dom_unranked_matches,
-        )
-        s.s_pins = compute_s_pins(s.pins, s.wins)
-        s.hodge_score = (
-            W_WL * s.s_wl
-            + W_REC * s.s_rec
-            + W_QUAL * s.s_qual
-            + W_DOM * s.s_dom
-            + W_PINS * s.s_pins
-        )
-
-    def green_scale01(t: float) -> str:
-        """
-        Map t in [0,1] to a light-to-dark green hex color.
-        t=0 -> very light green, t=1 -> dark green.
-        """
-        t = max(0.0, min(1.0, t))
-        # Light and dark green RGB anchors
-        light = (230, 244, 234)  # #e6f4ea
-        dark = (21, 87, 36)      # #155724
-        r = int(light[0] + (dark[0] - light[0]) * t)
-        g = int(light[1] + (dark[1] - light[1]) * t)
-        b = int(light[2] + (dark[2] - light[2]) * t)
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    # Sort candidates by overall Hodge formula score (primary) then by weight rank.
-    scored_candidates = sorted(
-        filtered_candidates, key=lambda s: (-s.hodge_score, s.weight_rank)
-    )
+    # Sort candidates by overall Hodge formula score (primary) then by weight
+    # rank, then materialize rows for the reports.
+    scored_candidates: List[HodgeStats] = [
+        filtered_candidates.row(i) for i in filtered_candidates.sort_order()
+    ]
 
     # --- Report 1: summary view (sorted by HodgeScore) ---
 
@@ -652,59 +1233,6 @@ def main() -> None:
 
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    html = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        f"<meta charset='utf-8'>",
-        f"<title>Hodge Trophy Candidates - Season {season}</title>",
-        "<style>",
-        "body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }",
-        "h1 { margin-top: 0; }",
-        ".meta { margin-bottom: 16px; color: #555; }",
-        "table { border-collapse: collapse; width: 100%; font-size: 12px; background-color: #fff; }",
-        "th, td { border: 1px solid #ddd; padding: 6px 8px; text-align: center; }",
-        "th { background-color: #f0f0f0; position: sticky; top: 0; z-index: 2; }",
-        "thead th { white-space: nowrap; }",
-        "tbody tr:nth-child(even) { background-color: #fafafa; }",
-        "tbody tr:hover { background-color: #f1f7ff; }",
-        ".name-cell { text-align: left; }",
-        ".team-cell { text-align: left; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        f"<h1>Hodge Trophy Candidates &mdash; Season {season}</h1>",
-        f"<div class='meta'>",
-        f"Top {args.top_n} per weight class; max losses={args.maxloss}, "
-        f"min matches={args.minmatch}. Ranked wins and bonus stats computed "
-        f"against current top-33 in the same and adjacent weights. ",
-        f"Generated at {generated_at}.",
-        "</div>",
-    ]
-
-    # First: detailed Hodge formula scores table (the "formula" view).
-    html.extend(
-        [
-            "<h2>Hodge Formula Scores (sorted by HodgeScore)</h2>",
-            "<table>",
-            "<thead>",
-            "<tr>",
-            "<th>#</th>",
-            "<th>Name</th>",
-            "<th>Team</th>",
-            "<th>Wt</th>",
-            "<th>W-L</th>",
-            "<th>Score</th>",
-            "<th>WtCl Rank</th>",
-            "<th>Quality<br>of Competition</th>",
-            "<th>Dominance Score</th>",
-            "<th>Pin%</th>",
-            "</tr>",
-            "</thead>",
-            "<tbody>",
-        ]
-    )
-
     # Precompute rank range for WtCl coloring so best rank is darkest, worst is lightest.
     rank_values = [s.weight_rank for s in scored_candidates if s.weight_rank < 999]
     if rank_values:
@@ -714,96 +1242,105 @@ def main() -> None:
         min_rank = 1
         max_rank = 1
 
-    for idx, s in enumerate(scored_candidates, start=1):
-        wl = f"{s.wins}-{s.losses}"
-        # Rank: map best ranks (lowest value) to dark green, worst (highest) to light.
-        if max_rank > min_rank:
-            rank_t = (max_rank - float(s.weight_rank)) / (max_rank - min_rank)
-            rank_t = max(0.0, min(1.0, rank_t))
-        else:
-            rank_t = 1.0
-        wtcl_color = green_scale01(rank_t)
-        # Quality, dominance, and pin scores get their own green shades based on 0–100 scale.
-        qual_color = green_scale01(s.s_qual / 100.0)
-        dom_color = green_scale01(s.s_dom / 100.0)
-        pin_color = green_scale01(s.s_pins / 100.0)
-        pin_pct_display = s.fall_pct * 100.0
-
-        html.append(
-            "<tr>"
-            f"<td>{idx}</td>"
-            f"<td class='name-cell'>{s.name}</td>"
-            f"<td class='team-cell'>{s.team}</td>"
-            f"<td>{s.weight_class}</td>"
-            f"<td>{wl}</td>"
-            f"<td>{s.hodge_score:.2f}</td>"
-            f"<td style='background-color:{wtcl_color};'>{s.weight_rank}</td>"
-            f"<td style='background-color:{qual_color};'>{s.s_qual:.1f}</td>"
-            f"<td style='background-color:{dom_color};'>{s.s_dom:.1f}</td>"
-            f"<td style='background-color:{pin_color};'>{pin_pct_display:.1f}</td>"
-            "</tr>"
-        )
-
-    html.extend(
-        [
-            "</tbody>",
-            "</table>",
-        ]
-    )
-
-    # Then: high-level summary table.
-    html.extend(
-        [
-            "<h2>Summary (sorted by HodgeScore)</h2>",
-            "<table>",
-            "<thead>",
-            "<tr>",
-            "<th>#</th>",
-            "<th>Name</th>",
-            "<th>Team</th>",
-            "<th>Wt</th>",
-            "<th>W-L</th>",
-            "<th>Win%</th>",
-            "<th>Bonus%</th>",
-            "<th>Fall%</th>",
-            "<th>RkW</th>",
-            "<th>Top10W</th>",
-            "<th>RkBon%</th>",
-            "</tr>",
-            "</thead>",
-            "<tbody>",
-        ]
-    )
-
-    for idx, s in enumerate(scored_candidates, start=1):
-        wl = f"{s.wins}-{s.losses}"
-        html.append(
-            "<tr>"
-            f"<td>{idx}</td>"
-            f"<td class='name-cell'>{s.name}</td>"
-            f"<td class='team-cell'>{s.team}</td>"
-            f"<td>{s.weight_class}</td>"
-            f"<td>{wl}</td>"
-            f"<td>{s.win_pct:.3f}</td>"
-            f"<td>{s.bonus_pct:.3f}</td>"
-            f"<td>{s.fall_pct:.3f}</td>"
-            f"<td>{s.ranked_wins}</td>"
-            f"<td>{s.top10_wins}</td>"
-            f"<td>{s.ranked_bonus_pct:.3f}</td>"
-            "</tr>"
+    # Write the page straight to disk, one write per row (each row starts on
+    # a new line).
+    with html_path.open("w", encoding="utf-8") as f:
+        w = f.write
+        w(
+            HTML_HEAD_TEMPLATE.format(
+                season=season,
+                top_n=args.top_n,
+                maxloss=args.maxloss,
+                minmatch=args.minmatch,
+                generated_at=generated_at,
+            )
         )
 
-    html.extend(
-        [
-            "</tbody>",
-            "</table>",
-            "</body>",
-            "</html>",
-        ]
-    )
+        # First: detailed Hodge formula scores table (the "formula" view).
+        w(HTML_FORMULA_TABLE_HEAD)
+        for idx, s in enumerate(scored_candidates, start=1):
+            # Rank: map best ranks (lowest value) to dark green, worst (highest) to light.
+            if max_rank > min_rank:
+                rank_t = (max_rank - float(s.weight_rank)) / (max_rank - min_rank)
+                rank_t = max(0.0, min(1.0, rank_t))
+            else:
+                rank_t = 1.0
+            # Quality, dominance, and pin scores get their own green shades based on 0–100 scale.
+            w(
+                "".join(
+                    (
+                        "\n<tr><td>",
+                        str(idx),
+                        "</td><td class='name-cell'>",
+                        str(s.name),
+                        "</td><td class='team-cell'>",
+                        str(s.team),
+                        "</td><td>",
+                        s.weight_class,
+                        "</td><td>",
+                        str(s.wins),
+                        "-",
+                        str(s.losses),
+                        "</td><td>",
+                        format(s.hodge_score, ".2f"),
+                        "</td>",
+                        GREEN_TD_OPEN[green_step(rank_t)],
+                        str(s.weight_rank),
+                        "</td>",
+                        GREEN_TD_OPEN[green_step(s.s_qual / 100.0)],
+                        format(s.s_qual, ".1f"),
+                        "</td>",
+                        GREEN_TD_OPEN[green_step(s.s_dom / 100.0)],
+                        format(s.s_dom, ".1f"),
+                        "</td>",
+                        GREEN_TD_OPEN[green_step(s.s_pins / 100.0)],
+                        format(s.fall_pct * 100.0, ".1f"),
+                        "</td></tr>",
+                    )
+                )
+            )
+        w(HTML_TABLE_TAIL)
+
+        # Then: high-level summary table.
+        w(HTML_SUMMARY_TABLE_HEAD)
+        for idx, s in enumerate(scored_candidates, start=1):
+            w(
+                "".join(
+                    (
+                        "\n<tr><td>",
+                        str(idx),
+                        "</td><td class='name-cell'>",
+                        str(s.name),
+                        "</td><td class='team-cell'>",
+                        str(s.team),
+                        "</td><td>",
+                        s.weight_class,
+                        "</td><td>",
+                        str(s.wins),
+                        "-",
+                        str(s.losses),
+                        "</td><td>",
+                        format(s.win_pct, ".3f"),
+                        "</td><td>",
+                        format(s.bonus_pct, ".3f"),
+                        "</td><td>",
+                        format(s.fall_pct, ".3f"),
+                        "</td><td>",
+                        str(s.ranked_wins),
+                        "</td><td>",
+                        str(s.top10_wins),
+                        "</td><td>",
+                        format(s.ranked_bonus_pct, ".3f"),
+                        "</td></tr>",
+                    )
+                )
+            )
+        w(HTML_TAIL)
 
-    with html_path.open("w", encoding="utf-8") as f:
-        f.write("\n".join(html))
+    if args.gzip:
+        gz_path = html_path.with_name(html_path.name + ".gz")
+        with html_path.open("rb") as src, gzip.open(gz_path, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
 
     print(f"\nHTML report written to {html_path}\n")
     try:
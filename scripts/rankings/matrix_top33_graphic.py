@@ -29,7 +29,7 @@ from typing import Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
-from generate_matrix import build_matrix_data
+from generate_matrix import CellData, build_matrix_data
 
 
 def abbreviate_name(full_name: str) -> str:
@@ -293,14 +293,17 @@ def draw_matrix_top33(
     avoid large unused white margins.
     """
     wrestlers: List[Dict] = matrix_data["wrestlers"]
-    matrix: Dict[str, Dict] = matrix_data["matrix"]
+    matrix: List[List[Optional[CellData]]] = matrix_data["matrix"]
+    # Positions in the full matrix, kept alongside the filtered list
+    positions = list(range(len(wrestlers)))
 
     if starters_only:
         # Filter to official starters only, based on is_starter flag that
         # build_matrix_data computed using the starter_map from rankings.
-        wrestlers = [w for w in wrestlers if w.get("is_starter", True)]
-    n = min(33, len(wrestlers))
-    wrestlers = wrestlers[:n]
+        positions = [k for k in positions if wrestlers[k].get("is_starter", True)]
+    n = min(33, len(positions))
+    positions = positions[:n]
+    wrestlers = [wrestlers[k] for k in positions]
 
     # Layout constants
     W = width
@@ -422,8 +425,8 @@ def draw_matrix_top33(
 
     # Draw matrix cells
     today = datetime.now().date()
-    for i, w_row in enumerate(wrestlers):
-        for j, w_col in enumerate(wrestlers):
+    for i in range(n):
+        for j in range(n):
             x0 = left_width + j * cell_size
             y0 = top_height + i * cell_size
             x1 = x0 + cell_size
@@ -434,11 +437,15 @@ def draw_matrix_top33(
                 draw.rectangle([x0, y0, x1, y1], fill=color, outline=(220, 220, 220))
                 continue
 
-            cell_key = f"{w_row['id']}_{w_col['id']}"
-            cell = matrix.get(cell_key, {"type": "none"})
-            ctype = cell.get("type", "none")
-            severity = cell.get("severity")
-            color = color_for_cell(ctype, severity)
+            cell = matrix[positions[i]][positions[j]]
+            if cell is None:
+                draw.rectangle(
+                    [x0, y0, x1, y1],
+                    fill=color_for_cell("none", None),
+                    outline=(230, 230, 230),
+                )
+                continue
+            color = color_for_cell(cell.type, cell.severity)
 
             # Base cell rectangle
             draw.rectangle([x0, y0, x1, y1], fill=color, outline=(230, 230, 230))
@@ -447,10 +454,10 @@ def draw_matrix_top33(
             # within the configured window (recent_days), draw a thicker border.
             # We use a solid black border so it stands out clearly even on
             # strong red/green cells (falls/tech falls).
-            if recent_days is not None and cell.get("matches"):
+            if recent_days is not None and cell.matches:
                 # Reuse the is_recent_date logic implicitly by checking days delta here.
                 recent = False
-                for m in cell["matches"]:
+                for m in cell.matches:
                     d_str = m.get("date", "")
                     try:
                         d = datetime.strptime(d_str, "%m/%d/%Y").date()
@@ -468,7 +475,7 @@ def draw_matrix_top33(
                         width=4,
                     )
 
-            val = cell.get("value", "")
+            val = cell.value
             if val:
                 # Draw cell text centered; use textbbox when available for sizing.
                 try: